@@ -0,0 +1,246 @@
+#!/usr/bin/env python3
+"""
+Bankroll simulation with bet sizing.
+
+Every session starts with the same bankroll and plays rounds
+(BLACKJACK pays 3:2) with flat, proportional or Kelly-style betting
+by the true count, until the rounds are over or the player is ruined.
+Final bankrolls are collected by streaming statistics (Welford's mean
+and variance, P-square percentiles), so memory does not depend
+on the number of sessions.
+"""
+import argparse
+import random
+
+import cardcounter
+import cardshoe
+import simulator
+
+# Define default session: bankroll and table minimum (in money units)
+BANKROLL = 1000
+MIN_BET = 10
+ROUNDS = 100
+SESSIONS = 10_000
+
+# Define bet sizing: part of bankroll for proportional betting,
+# part of Kelly bet, variance of a hand, edge per true count and max spread
+BET_FRACTION = 0.02
+KELLY_FRACTION = 0.5
+HAND_VARIANCE = 1.3
+EDGE_PER_COUNT = 0.005
+MAX_SPREAD = 12
+
+# Define reported percentiles of final bankroll
+PERCENTILES = (0.05, 0.25, 0.5, 0.75, 0.95)
+
+
+def main():
+    """Run bankroll simulation and show the report."""
+    parser = argparse.ArgumentParser(
+        description='Simulate blackjack bankroll with bet sizing.')
+    parser.add_argument('-n', '--sessions', type=int, default=SESSIONS,
+                        help=f'number of sessions (default {SESSIONS})')
+    parser.add_argument('-r', '--rounds', type=int, default=ROUNDS,
+                        help=f'rounds per session (default {ROUNDS})')
+    parser.add_argument('-b', '--betting', choices=sorted(BETTING),
+                        default='flat', help='bet sizing')
+    parser.add_argument('--bankroll', type=float, default=BANKROLL,
+                        help=f'starting bankroll (default {BANKROLL})')
+    parser.add_argument('--min-bet', type=float, default=MIN_BET,
+                        help=f'table minimum bet (default {MIN_BET})')
+    parser.add_argument('-d', '--decks', type=int, default=cardshoe.DECKS,
+                        help=f'number of decks (default {cardshoe.DECKS})')
+    parser.add_argument('-s', '--seed', type=int,
+                        help='seed of random generator')
+    args = parser.parse_args()
+
+    rng = None if args.seed is None else random.Random(args.seed)
+    stats, percentiles, ruined = simulate_sessions(
+        args.sessions, args.rounds, BETTING[args.betting],
+        args.bankroll, args.min_bet, decks=args.decks, rng=rng)
+    show_bankroll_report(stats, percentiles, ruined)
+
+
+class RunningStats:
+    """Count, mean and variance of a stream (Welford's algorithm)."""
+
+    def __init__(self):
+        """Create empty statistics."""
+        self.count = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+
+    def add(self, value):
+        """Add a value of the stream."""
+        self.count += 1
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self.m2 += delta * (value - self.mean)
+
+    def variance(self):
+        """Return sample variance."""
+        return self.m2 / (self.count - 1) if self.count > 1 else 0.0
+
+    def stdev(self):
+        """Return sample standard deviation."""
+        return self.variance() ** 0.5
+
+
+class P2Quantile:
+    """Streaming estimate of a quantile by five markers (P-square)."""
+
+    def __init__(self, p):
+        """Create estimator of quantile p (from 0 to 1)."""
+        self.p = p
+        self.heights = []
+        self.positions = [1, 2, 3, 4, 5]
+        self.desired = [1, 1 + 2 * p, 1 + 4 * p, 3 + 2 * p, 5]
+        self.increments = [0, p / 2, p, (1 + p) / 2, 1]
+
+    def add(self, value):
+        """Add a value of the stream and adjust markers."""
+        heights = self.heights
+        positions = self.positions
+
+        # Collect first five values exactly
+        if len(heights) < 5:
+            heights.append(value)
+            heights.sort()
+            return
+
+        # Find cell of the value and move markers above it
+        if value < heights[0]:
+            heights[0] = value
+            cell = 0
+        elif value >= heights[4]:
+            heights[4] = value
+            cell = 3
+        else:
+            cell = 0
+            while value >= heights[cell + 1]:
+                cell += 1
+
+        for index in range(cell + 1, 5):
+            positions[index] += 1
+        for index in range(5):
+            self.desired[index] += self.increments[index]
+
+        # Adjust heights of middle markers if they are off desired positions
+        for index in range(1, 4):
+            delta = self.desired[index] - positions[index]
+            if ((delta >= 1 and positions[index + 1] - positions[index] > 1) or
+                    (delta <= -1 and
+                     positions[index - 1] - positions[index] < -1)):
+                step = 1 if delta > 0 else -1
+                height = self._parabolic(index, step)
+                if not heights[index - 1] < height < heights[index + 1]:
+                    height = self._linear(index, step)
+                heights[index] = height
+                positions[index] += step
+
+    def _parabolic(self, index, step):
+        """Return piecewise-parabolic prediction of marker's height."""
+        q = self.heights
+        n = self.positions
+        return q[index] + step / (n[index + 1] - n[index - 1]) * (
+            (n[index] - n[index - 1] + step) * (q[index + 1] - q[index]) /
+            (n[index + 1] - n[index]) +
+            (n[index + 1] - n[index] - step) * (q[index] - q[index - 1]) /
+            (n[index] - n[index - 1]))
+
+    def _linear(self, index, step):
+        """Return linear prediction of marker's height."""
+        q = self.heights
+        n = self.positions
+        return q[index] + step * (q[index + step] - q[index]) / (
+            n[index + step] - n[index])
+
+    def value(self):
+        """Return estimated quantile."""
+        if not self.heights:
+            return 0.0
+        if len(self.heights) < 5:
+            return self.heights[round(self.p * (len(self.heights) - 1))]
+        return self.heights[2]
+
+
+def flat_bet(bankroll, true_count, min_bet):
+    """Bet table minimum every round."""
+    return min_bet
+
+
+def proportional_bet(bankroll, true_count, min_bet):
+    """Bet fixed part of current bankroll."""
+    return max(min_bet, bankroll * BET_FRACTION)
+
+
+def kelly_bet(bankroll, true_count, min_bet):
+    """Bet part of Kelly bet by player's edge estimated from true count."""
+    # Player's edge is about -0.5% at true count 0 and +0.5% per count
+    edge = (true_count - 1) * EDGE_PER_COUNT
+    if edge <= 0:
+        return min_bet
+
+    bet = bankroll * KELLY_FRACTION * edge / HAND_VARIANCE
+    return min(max(min_bet, bet), min_bet * MAX_SPREAD)
+
+
+# Bet sizing by names - functions of (bankroll, true count, table minimum)
+BETTING = {'flat': flat_bet,
+           'proportional': proportional_bet,
+           'kelly': kelly_bet}
+
+
+def play_session(shoe, rounds, betting, bankroll, min_bet, policy):
+    """Play rounds of session and return final bankroll (0 if ruined)."""
+    for _ in range(rounds):
+        if bankroll < min_bet:
+            return 0.0
+
+        shoe.start_round()
+        bet = min(bankroll, betting(bankroll, shoe.true_count(), min_bet))
+        outcome, player_hand, _ = simulator.play_hand(shoe, policy)
+        bankroll += bet * simulator.hand_payout(outcome, player_hand)
+
+    return bankroll if bankroll >= min_bet else 0.0
+
+
+def simulate_sessions(sessions, rounds, betting, bankroll=BANKROLL,
+                      min_bet=MIN_BET, policy=None, decks=cardshoe.DECKS,
+                      penetration=cardshoe.PENETRATION, rng=None):
+    """
+    Play sessions from one counting shoe and collect final bankrolls.
+
+    Returns running statistics, dict of percentile estimators
+    and number of ruined sessions.
+    """
+    policy = simulator.POLICIES['basic'] if policy is None else policy
+    shoe = cardcounter.CountingShoe(decks, penetration, rng)
+    stats = RunningStats()
+    percentiles = {p: P2Quantile(p) for p in PERCENTILES}
+    ruined = 0
+
+    for _ in range(sessions):
+        final = play_session(shoe, rounds, betting, bankroll, min_bet, policy)
+        ruined += final == 0
+
+        stats.add(final)
+        for estimator in percentiles.values():
+            estimator.add(final)
+
+    return stats, percentiles, ruined
+
+
+def show_bankroll_report(stats, percentiles, ruined):
+    """Print statistics of final bankrolls and risk of ruin."""
+    print(f'Simulated sessions: {stats.count}')
+    print(f'- mean bankroll: {stats.mean:.2f} (stdev {stats.stdev():.2f})')
+    for p, estimator in percentiles.items():
+        print(f'- {p:.0%} percentile: {estimator.value():.2f}')
+
+    risk = ruined / stats.count if stats.count else 0.0
+    print(f'Risk of ruin: {risk:.2%}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+"""
+Measure throughput of the blackjack engine.
+
+Every benchmark reports operations (cards, hands) per second, the best
+of several repeats. Results are appended to a JSON file with a label
+(version) and compared with the previous run to show regressions.
+"""
+import argparse
+import json
+import os
+import random
+import timeit
+from datetime import datetime
+
+import blackjack
+import cardshoe
+import simulator
+import strategysolver
+
+# Define benchmarked numbers of decks and default results file
+DECKS = (1, 6, 8)
+RESULTS = 'benchmark_results.json'
+
+
+def main():
+    """Run benchmarks, show and save results."""
+    parser = argparse.ArgumentParser(
+        description='Measure throughput of the blackjack engine.')
+    parser.add_argument('-l', '--label', default='dev',
+                        help='label of the run, e.g. version (default dev)')
+    parser.add_argument('-o', '--output', default=RESULTS,
+                        help=f'JSON file with results (default {RESULTS})')
+    parser.add_argument('-r', '--repeat', type=int, default=5,
+                        help='number of repeats (default 5)')
+    args = parser.parse_args()
+
+    runs = load_runs(args.output)
+    previous = runs[-1]['results'] if runs else {}
+
+    results = run_benchmarks(args.repeat)
+    show_results(results, previous)
+
+    runs.append({'label': args.label,
+                 'date': datetime.now().isoformat(timespec='seconds'),
+                 'results': results})
+    save_runs(runs, args.output)
+    print(f'Results are saved to {args.output}.')
+
+
+def measure(statement, number, repeat, setup='pass', **names):
+    """Return operations per second (best of repeats)."""
+    timer = timeit.Timer(statement, setup, globals=names)
+    return number / min(timer.repeat(repeat, number))
+
+
+def run_benchmarks(repeat=5):
+    """Run all benchmarks and return dict of operations per second."""
+    rng = random.Random(0)
+    results = {}
+
+    # Sample hands for scoring (every hand of 2-4 cards)
+    shoe = cardshoe.Shoe(8, rng=rng)
+    hands = [blackjack.Hand(blackjack.deal_card(shoe)
+                            for _ in range(rng.randint(2, 4)))
+             for _ in range(1000)]
+
+    results['count_hand'] = measure(
+        'for hand in hands: count_hand(hand)', 100, repeat,
+        count_hand=blackjack.count_hand, hands=hands) * len(hands)
+    results['Hand'] = measure(
+        'for hand in hands: Hand(hand)', 100, repeat,
+        Hand=blackjack.Hand, hands=hands) * len(hands)
+    results['check_blackjack'] = measure(
+        'for hand in hands: check_blackjack(hand)', 100, repeat,
+        check_blackjack=blackjack.check_blackjack, hands=hands) * len(hands)
+
+    for decks in DECKS:
+        results[f'create_cards[{decks}]'] = measure(
+            'create_cards(decks, rng)', 1000, repeat,
+            create_cards=blackjack.create_cards, decks=decks, rng=rng)
+
+        shoe = cardshoe.Shoe(decks, rng=rng)
+        results[f'deal_card[{decks}]'] = measure(
+            'deal_card(shoe)', 100_000, repeat,
+            deal_card=blackjack.deal_card, shoe=shoe)
+
+        results[f'hand[{decks}]'] = measure(
+            'shoe.start_round(); play_hand(shoe, policy)', 10_000, repeat,
+            play_hand=simulator.play_hand, shoe=shoe,
+            policy=strategysolver.basic_strategy)
+
+    return results
+
+
+def show_results(results, previous):
+    """Print operations per second with change from the previous run."""
+    for name, value in results.items():
+        line = f'{name:<20}{value:>16,.0f}/s'
+        if name in previous:
+            line += f'{value / previous[name] - 1:>+10.1%}'
+        print(line)
+
+
+def load_runs(path):
+    """Load list of previous runs from JSON file (if exists)."""
+    if not os.path.exists(path):
+        return []
+
+    with open(path) as file:
+        return json.load(file)
+
+
+def save_runs(runs, path):
+    """Save list of runs to JSON file."""
+    with open(path, 'w') as file:
+        json.dump(runs, file, indent=2)
+
+
+if __name__ == '__main__':
+    main()
@@ -6,12 +6,23 @@ Classic casino rules (except splitting of players' pocket cards).
 Implements S17 rule - dealer must draw on 16 or less, and stand on 17 or more.
 The program creates and uses only one card desk per game.
 """
-from random import randrange
+import random
+from array import array
 
 # Define winning constants
 WIN_SCORE = 21
 STAND_ON_SOFT = 17
 
+# Define player's choices
+HIT = 1
+STAND = 0
+
+# Define constants for card decks (card is a code 0-51 of rank and suit)
+RANKS = ('2', '3', '4', '5', '6', '7', '8', '9', '10', 'J', 'Q', 'K', 'A')
+SUITS = ('clubs', 'diamonds', 'hearts', 'spades')
+VALUES = (2, 3, 4, 5, 6, 7, 8, 9, 10, 10, 10, 10, 1)
+CARD_VALUES = tuple(value for value in VALUES for _ in SUITS)
+
 
 def main():
     """Run main program."""
@@ -26,8 +37,8 @@ def main():
     print()
 
     # Create hands for player and dealer
-    player_hand = []
-    dealer_hand = []
+    player_hand = Hand()
+    dealer_hand = Hand()
 
     # Create flags if anybody exceeds 21
     player_exceed = False
@@ -53,7 +64,7 @@ def main():
     print()
     print('Your hand:')
     show_hand(player_hand)
-    player_total = count_hand(player_hand)
+    player_total = player_hand.total
     print()
 
     # Check if player has BLACKJACK
@@ -98,14 +109,14 @@ def main():
             print('take another card (HIT=1) or pass (STAND=0).')
             hit = check_choice()
 
-            if hit == 1:
+            if hit == HIT:
                 another_card = deal_card(card_deck)
                 player_hand.append(another_card)
                 print()
                 print('Additional card  to you, Player_1.')
                 print('Your hand:')
                 show_hand(player_hand)
-                player_total = count_hand(player_hand)
+                player_total = player_hand.total
                 print(f'Your total: {player_total}')
 
                 # Check if player exceeds 21
@@ -119,7 +130,7 @@ def main():
         print()
         print('Opening dealer\'s hand.')
         show_hand(dealer_hand)
-        dealer_total = count_hand(dealer_hand)
+        dealer_total = dealer_hand.total
         print(f'Dealer\'s total: {dealer_total}')
 
         # Dealer hits or stands
@@ -131,7 +142,7 @@ def main():
                 dealer_hand.append(another_card)
                 print('Dealer\'s hand:')
                 show_hand(dealer_hand)
-                dealer_total = count_hand(dealer_hand)
+                dealer_total = dealer_hand.total
                 print(f'Dealer\'s total: {dealer_total}')
 
                 # Check if dealer exceeds 21
@@ -201,57 +212,46 @@ def show_rules():
     print('- hand (cards) that is closer to 21 but less 22, wins.')
 
 
-def create_cards():
-    """Create new card deck."""
-    # Constants for card decks
-    ranks = ['2', '3', '4', '5', '6', '7', '8', '9', '10', 'J', 'Q', 'K', 'A']
-    suits = ['clubs', 'diamonds', 'hearts', 'spades']
-    vals = [2, 3, 4, 5, 6, 7, 8, 9, 10, 10, 10, 10, 1]
-
-    # Create list of cards (rank with value)
-    cards = []
+def create_cards(decks=1, rng=None):
+    """Create new shuffled card deck (array of card codes)."""
+    card_deck = array('B', range(len(CARD_VALUES))) * decks
+    (random if rng is None else rng).shuffle(card_deck)
 
-    for rank in ranks:
-        for suit in suits:
-            cards.append(f'{rank} of {suit}')
+    return card_deck
 
-    # Multiply values for all 52 cards
-    values = []
 
-    for value in vals:
-        for cycle in range(4):
-            values.append(value)
-
-    # Create and return card deck - dict of tuples (card, value)
-    return list(zip(cards, values))
+def deal_card(card_deck):
+    """Deal a card from the top of the shuffled card deck."""
+    return card_deck.pop()
 
 
-def deal_card(card_deck):
-    """Deal a card from the playing card deck."""
-    return card_deck.pop(randrange(0, len(card_deck)))
+def card_name(card):
+    """Return card's name (rank and suit) by its code."""
+    rank, suit = divmod(card, len(SUITS))
+    return f'{RANKS[rank]} of {SUITS[suit]}'
 
 
 def show_card(dealt_card):
     """Show popped card."""
-    card, value = dealt_card
-    print(f'{card}: {value=}')
+    value = CARD_VALUES[dealt_card]
+    print(f'{card_name(dealt_card)}: {value=}')
 
 
 def show_hand(hand):
     """Show player's/dealer's hand."""
     for index, card in enumerate(hand):
-        print(f'{index+1}) {card[0]}')
+        print(f'{index+1}) {card_name(card)}')
 
 
 def show_half_hand(hand):
     """Show dealer's pocket hand with one card face down."""
-    print(f'1) {hand[0][0]}')
+    print(f'1) {card_name(hand[0])}')
     print('2) Card is face down')
 
 
 def show_one_card(hand):
     """Show dealer's pocket card which is face up."""
-    print(f'(Dealer\'s card is {hand[0][0]})')
+    print(f'(Dealer\'s card is {card_name(hand[0])})')
 
 
 def count_hand(hand):
@@ -260,22 +260,60 @@ def count_hand(hand):
     is_ace = False
 
     for card in hand:
-        if card[1] == 1:
-            total += 11
+        value = CARD_VALUES[card]
+        total += value
+        if value == 1:
             is_ace = True
 
-            if total > 21:
-                total -= 10
-                is_ace = False
-        else:
-            total += card[1]
-            if total > 21 and is_ace:
-                total -= 10
-                is_ace = False
+    # Count one ace as 11 if the total does not exceed 21
+    if is_ace and total + 10 <= WIN_SCORE:
+        total += 10
 
     return total
 
 
+class Hand:
+    """Player's/dealer's hand keeping its total up to date."""
+
+    __slots__ = ('cards', 'hard_total', 'has_ace', 'total', 'is_soft')
+
+    def __init__(self, cards=()):
+        """Create hand with given cards (empty by default)."""
+        self.cards = []
+        self.hard_total = 0
+        self.has_ace = False
+        self.total = 0
+        self.is_soft = False
+
+        for card in cards:
+            self.append(card)
+
+    def __len__(self):
+        """Return number of cards."""
+        return len(self.cards)
+
+    def __iter__(self):
+        """Iterate over cards."""
+        return iter(self.cards)
+
+    def __getitem__(self, index):
+        """Return card by index."""
+        return self.cards[index]
+
+    def append(self, card):
+        """Add card to hand and update its total and soft flag."""
+        self.cards.append(card)
+        value = CARD_VALUES[card]
+        self.hard_total += value
+
+        if value == 1:
+            self.has_ace = True
+
+        # Count one ace as 11 if the total does not exceed 21
+        self.is_soft = self.has_ace and self.hard_total + 10 <= WIN_SCORE
+        self.total = self.hard_total + 10 if self.is_soft else self.hard_total
+
+
 def get_user_choice():
     """Input user's choice to hit or stand."""
     # Get and assert user's choice
@@ -305,19 +343,22 @@ def check_choice():
 
 def check_blackjack(hand):
     """Check if Blackjack."""
-    return True if count_hand(hand) == WIN_SCORE else False
+    return hand.total == WIN_SCORE
+
+
+def check_soft(hand):
+    """Check if hand is soft (an ace counts as 11)."""
+    return hand.is_soft
 
 
 def check_s17(hand):
-    """Check if S17 (stand-on-soft-17) for dealer."""
-    return True if (count_hand(hand) == STAND_ON_SOFT and
-                    len(hand) == 2 and
-                    (hand[0][1] == 1 or hand[1][1] == 1)) else False
+    """Check if soft 17 (dealer stands on it by S17 rule, hits by H17)."""
+    return hand.total == STAND_ON_SOFT and hand.is_soft
 
 
 def check_exceeding(hand):
     """Check if anybody exceeds 21."""
-    return True if count_hand(hand) > WIN_SCORE else False
+    return hand.total > WIN_SCORE
 
 
 if __name__ == '__main__':
@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+"""
+Card counting over the stream of cards dealt from the shoe.
+
+The running count is updated by the counting system's tag of every card
+when it is dealt from the shoe (and reset when the shoe is reshuffled),
+the true count is the running count per remaining deck.
+Simulation reports player's edge by true count before the round.
+"""
+import argparse
+import math
+import os
+from collections import Counter
+
+import blackjack
+import cardshoe
+import simrunner
+import simulator
+
+# Define tags of counting systems by card values (ace, 2, 3, ..., 10)
+SYSTEMS = {'hi-lo': (-1, 1, 1, 1, 1, 1, 0, 0, 0, -1),
+           'hi-opt-i': (0, 0, 1, 1, 1, 1, 0, 0, 0, -1),
+           'hi-opt-ii': (0, 1, 1, 2, 2, 1, 1, 0, 0, -2),
+           'ko': (-1, 1, 1, 1, 1, 1, 1, 0, 0, -1),
+           'omega-ii': (0, 1, 1, 2, 2, 2, 1, 0, -1, -2),
+           'zen': (-1, 1, 1, 2, 2, 2, 1, 0, 0, -2)}
+
+
+def main():
+    """Run counting simulation and show the report."""
+    parser = argparse.ArgumentParser(
+        description='Simulate card counting in blackjack.')
+    parser.add_argument('-n', '--rounds', type=int, default=simulator.HANDS,
+                        help=f'number of rounds (default {simulator.HANDS})')
+    parser.add_argument('-p', '--policy', choices=sorted(simulator.POLICIES),
+                        default='basic', help='player policy')
+    parser.add_argument('-m', '--system', choices=sorted(SYSTEMS),
+                        default='hi-lo', help='counting system')
+    parser.add_argument('-d', '--decks', type=int, default=cardshoe.DECKS,
+                        help=f'number of decks (default {cardshoe.DECKS})')
+    parser.add_argument('-c', '--penetration', type=float,
+                        default=cardshoe.PENETRATION,
+                        help='part of shoe dealt before reshuffle '
+                             f'(default {cardshoe.PENETRATION})')
+    parser.add_argument('-w', '--workers', type=int, default=os.cpu_count(),
+                        help='number of worker processes')
+    parser.add_argument('-s', '--seed', type=int, default=0,
+                        help='seed of random generators (default 0)')
+    args = parser.parse_args()
+
+    tally = simrunner.run_parallel(simulate_counting, args.rounds,
+                                   simulator.POLICIES[args.policy],
+                                   args.decks, args.penetration, args.system,
+                                   workers=args.workers, seed=args.seed)
+    show_count_report(tally)
+
+
+class CountingShoe(cardshoe.Shoe):
+    """Card shoe which keeps running count of dealt cards."""
+
+    def __init__(self, decks=cardshoe.DECKS, penetration=cardshoe.PENETRATION,
+                 rng=None, system='hi-lo'):
+        """Create shoe counting cards by tags of the counting system."""
+        self.tags = tuple(SYSTEMS[system][value - 1]
+                          for value in blackjack.CARD_VALUES)
+        self.running_count = 0
+        super().__init__(decks, penetration, rng)
+
+    def shuffle(self):
+        """Collect all cards, shuffle them and reset the count."""
+        super().shuffle()
+        self.running_count = 0
+
+    def pop(self):
+        """Deal a card from the top of the shoe and count it."""
+        card = super().pop()
+        self.running_count += self.tags[card]
+        return card
+
+    def true_count(self):
+        """Return running count per remaining deck."""
+        decks_left = len(self.cards) / len(blackjack.CARD_VALUES)
+        return self.running_count / decks_left if decks_left else 0.0
+
+
+def simulate_counting(rounds, policy, decks=cardshoe.DECKS,
+                      penetration=cardshoe.PENETRATION, system='hi-lo',
+                      rng=None):
+    """
+    Play rounds from counting shoe and sum results by true count.
+
+    Returns Counter with ('rounds', true count) and ('net', true count)
+    keys, true count is rounded down to integer before every round.
+    """
+    tally = Counter()
+    shoe = CountingShoe(decks, penetration, rng, system)
+
+    for _ in range(rounds):
+        shoe.start_round()
+        true_count = math.floor(shoe.true_count())
+
+        outcome, player_hand, _ = simulator.play_hand(shoe, policy)
+        tally['rounds', true_count] += 1
+        tally['net', true_count] += simulator.hand_payout(outcome,
+                                                          player_hand)
+
+    return tally
+
+
+def show_count_report(tally):
+    """Print number of rounds and player's edge by true count."""
+    rounds = sum(value for (key, _), value in tally.items()
+                 if key == 'rounds')
+    true_counts = sorted(count for key, count in tally if key == 'rounds')
+
+    print(f'Simulated rounds: {rounds}')
+    print(f'{"True count":>10}{"Rounds":>14}{"Share":>9}{"Edge":>10}')
+    for true_count in true_counts:
+        number = tally['rounds', true_count]
+        edge = tally['net', true_count] / number
+        print(f'{true_count:>10}{number:>14}{number / rounds:>9.2%}'
+              f'{edge:>+10.2%}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+"""
+Card shoe of several decks dealt through to the cut card.
+
+The shoe persists across many rounds, cards are dealt from the top
+of the shuffled shoe and all cards are reshuffled only before the round
+when the cut card (placed by penetration) has been reached.
+"""
+import blackjack
+
+# Define default shoe: number of decks and part of cards dealt before reshuffle
+DECKS = 6
+PENETRATION = 0.75
+
+
+class Shoe:
+    """Shuffled card shoe with cut card (deal_card() deals from it)."""
+
+    def __init__(self, decks=DECKS, penetration=PENETRATION, rng=None):
+        """Create and shuffle shoe of decks, penetration is from 0 to 1."""
+        if decks < 1 or not 0 <= penetration <= 1:
+            raise ValueError(f'Wrong shoe: {decks=}, {penetration=}')
+
+        self.decks = decks
+        self.penetration = penetration
+        self.rng = rng
+        self.size = len(blackjack.CARD_VALUES) * decks
+        # Number of remaining cards when the cut card is reached
+        self.cut_card = self.size - int(self.size * penetration)
+        self.shuffles = 0
+        self.shuffle()
+
+    def __len__(self):
+        """Return number of remaining cards."""
+        return len(self.cards)
+
+    def shuffle(self):
+        """Collect all cards and shuffle them."""
+        self.cards = blackjack.create_cards(self.decks, self.rng)
+        self.shuffles += 1
+
+    def pop(self):
+        """Deal a card from the top of the shoe."""
+        # Reshuffle if the round has used all cards after the cut card
+        if not self.cards:
+            self.shuffle()
+
+        return self.cards.pop()
+
+    def needs_shuffle(self):
+        """Check if the cut card has been reached."""
+        return len(self.cards) <= self.cut_card
+
+    def start_round(self):
+        """Reshuffle the shoe before a round if the cut card is reached."""
+        if self.needs_shuffle():
+            self.shuffle()
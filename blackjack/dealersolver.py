@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+"""
+Exact probabilities of dealer's final totals.
+
+Dealer draws on 16 or less and stands on 17 or more (S17 rule).
+Probabilities of final totals (17-21 or BUST) are computed by recursion
+over counts of remaining cards, results are cached by shoe composition,
+so every state is computed once.
+"""
+import argparse
+from functools import lru_cache
+
+import blackjack
+
+# Define dealer's final totals (the last one is BUST)
+BUST = 'bust'
+OUTCOMES = (17, 18, 19, 20, 21, BUST)
+
+# Define card values in composition of shoe: counts of values 1 (ace) - 10
+CARD_RANGE = range(1, 11)
+
+
+def main():
+    """Show table of dealer's final totals for every up-card."""
+    parser = argparse.ArgumentParser(
+        description='Compute dealer\'s final totals.')
+    parser.add_argument('-d', '--decks', type=int, default=1,
+                        help='number of decks in shoe (default 1)')
+    parser.add_argument('--peek', action='store_true',
+                        help='dealer has no BLACKJACK (hole card checked)')
+    args = parser.parse_args()
+
+    print(f'{"Up":>3}' + ''.join(f'{outcome:>8}' for outcome in OUTCOMES))
+    for up_value in CARD_RANGE:
+        counts = shoe_composition(args.decks)
+        counts = remove_card(counts, up_value)
+        distribution = dealer_distribution(up_value, counts, args.peek)
+        print(f'{"A" if up_value == 1 else up_value:>3}' +
+              ''.join(f'{distribution[outcome]:>8.4f}'
+                      for outcome in OUTCOMES))
+
+
+def shoe_composition(decks=1):
+    """Return counts of card values (ace - 10) in a full shoe."""
+    counts = [0] * len(CARD_RANGE)
+
+    for value in blackjack.CARD_VALUES:
+        counts[value - 1] += decks
+
+    return tuple(counts)
+
+
+def remove_card(counts, value):
+    """Return counts of card values without one card of value."""
+    if not counts[value - 1]:
+        raise ValueError(f'No card of value {value} in shoe')
+
+    return counts[:value - 1] + (counts[value - 1] - 1,) + counts[value:]
+
+
+def dealer_distribution(up_value, counts, no_blackjack=False):
+    """
+    Return dict of probabilities of dealer's final totals.
+
+    Counts are remaining cards (without the up-card), when no_blackjack
+    the hole card is known not to make dealer's BLACKJACK.
+    """
+    remaining = 0
+    probabilities = [0.0] * len(OUTCOMES)
+
+    # Draw the hole card, skipping BLACKJACK if dealer has peeked
+    for value in CARD_RANGE:
+        count = counts[value - 1]
+        if not count:
+            continue
+        if no_blackjack and {up_value, value} == {1, 10}:
+            continue
+
+        remaining += count
+        outcomes = final_totals(up_value + value, 1 in (up_value, value),
+                                remove_card(counts, value))
+        for index, probability in enumerate(outcomes):
+            probabilities[index] += count * probability
+
+    return {outcome: probability / remaining
+            for outcome, probability in zip(OUTCOMES, probabilities)}
+
+
+@lru_cache(maxsize=None)
+def final_totals(hard_total, has_ace, counts):
+    """Return probabilities of final totals (tuple by OUTCOMES) from state."""
+    total = hard_total
+    if has_ace and total + 10 <= blackjack.WIN_SCORE:
+        total += 10
+
+    # Dealer exceeds 21 or stands on 17 or more
+    if total > blackjack.WIN_SCORE:
+        return tuple(1.0 if outcome == BUST else 0.0 for outcome in OUTCOMES)
+    if total >= blackjack.STAND_ON_SOFT:
+        return tuple(1.0 if outcome == total else 0.0 for outcome in OUTCOMES)
+
+    # Dealer takes another card of every value
+    remaining = sum(counts)
+    probabilities = [0.0] * len(OUTCOMES)
+
+    for value in CARD_RANGE:
+        count = counts[value - 1]
+        if not count:
+            continue
+
+        outcomes = final_totals(hard_total + value, has_ace or value == 1,
+                                remove_card(counts, value))
+        for index, probability in enumerate(outcomes):
+            probabilities[index] += count / remaining * probability
+
+    return tuple(probabilities)
+
+
+if __name__ == '__main__':
+    main()
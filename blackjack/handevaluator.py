@@ -0,0 +1,157 @@
+#!/usr/bin/env python3
+"""
+Score many blackjack hands at once with NumPy.
+
+Hands are held as rows of 2-D integer array of card values
+(ace is 1, empty places after the last card of hand are 0),
+so the whole batch is counted by a few vectorized operations.
+Batch simulation plays many hands at once and asks the player's policy
+for decisions of all pending hands by one call.
+"""
+from collections import Counter
+
+import numpy as np
+
+import blackjack
+import simulator
+
+# Values of all 52 cards of one card deck
+DECK_VALUES = np.array(blackjack.CARD_VALUES, dtype=np.int8)
+
+
+def hands_to_array(hands):
+    """Convert hands (lists of card codes) to 2-D array of values."""
+    width = max((len(hand) for hand in hands), default=0)
+    values = np.zeros((len(hands), width), dtype=np.int8)
+
+    for row, hand in enumerate(hands):
+        values[row, :len(hand)] = DECK_VALUES[list(hand)]
+
+    return values
+
+
+def deal_decks(number, rng=None):
+    """Create 2-D array of values of shuffled card decks (a deck per row)."""
+    rng = np.random.default_rng() if rng is None else rng
+    decks = np.broadcast_to(DECK_VALUES, (number, DECK_VALUES.size))
+
+    return rng.permuted(decks, axis=1)
+
+
+def count_hands(values):
+    """Count totals and soft flags of hands in rows of 2-D array."""
+    values = np.asarray(values)
+    hard_totals = values.sum(axis=1, dtype=np.int16)
+
+    return count_totals(hard_totals, (values == 1).any(axis=1))
+
+
+def count_totals(hard_totals, has_aces):
+    """Count totals and soft flags by hard totals and flags of aces."""
+    # Count one ace as 11 if the total does not exceed 21
+    is_soft = has_aces & (hard_totals + 10 <= blackjack.WIN_SCORE)
+    totals = np.where(is_soft, hard_totals + 10, hard_totals)
+
+    return totals, is_soft
+
+
+def check_blackjacks(values):
+    """Check which hands are Blackjacks (21 by first two cards)."""
+    totals, _ = count_hands(np.asarray(values)[:, :2])
+    return totals == blackjack.WIN_SCORE
+
+
+def check_exceedings(values):
+    """Check which hands exceed 21."""
+    totals, _ = count_hands(values)
+    return totals > blackjack.WIN_SCORE
+
+
+def simulate_batch(hands, policy, rng=None,
+                   blackjack_pays=simulator.BLACKJACK_PAYS):
+    """
+    Play hands at once (a new card deck for every hand) and count outcomes.
+
+    Policy is called with arrays of totals, soft flags and dealer's
+    up-card values of all pending hands and returns array of HIT/STAND.
+    """
+    decks = deal_decks(hands, rng).astype(np.int16)
+    rows = np.arange(hands)
+
+    # Deal pocket cards by turns: player's cards are 0 and 2, dealer's 1 and 3
+    player_hard = decks[:, 0] + decks[:, 2]
+    player_aces = (decks[:, 0] == 1) | (decks[:, 2] == 1)
+    dealer_hard = decks[:, 1] + decks[:, 3]
+    dealer_aces = (decks[:, 1] == 1) | (decks[:, 3] == 1)
+    up_values = decks[:, 1]
+    position = np.full(hands, 4)
+
+    player_totals, player_soft = count_totals(player_hard, player_aces)
+    dealer_totals, _ = count_totals(dealer_hard, dealer_aces)
+    player_blackjack = player_totals == blackjack.WIN_SCORE
+    dealer_blackjack = dealer_totals == blackjack.WIN_SCORE
+
+    # Ask policy for all pending hands while anybody hits
+    pending = ~(player_blackjack | dealer_blackjack)
+    pending &= player_totals < blackjack.WIN_SCORE
+    while pending.any():
+        indexes = rows[pending]
+        choices = np.asarray(policy.decide(player_totals[indexes],
+                                           player_soft[indexes],
+                                           up_values[indexes]))
+        pending[indexes[choices != blackjack.HIT]] = False
+
+        indexes = indexes[choices == blackjack.HIT]
+        cards = decks[indexes, position[indexes]]
+        position[indexes] += 1
+        player_hard[indexes] += cards
+        player_aces[indexes] |= cards == 1
+
+        player_totals, player_soft = count_totals(player_hard, player_aces)
+        pending &= player_totals < blackjack.WIN_SCORE
+
+    # Dealer draws while total is less than 17 if player does not exceed 21
+    drawing = ~(player_blackjack | dealer_blackjack)
+    drawing &= player_totals <= blackjack.WIN_SCORE
+    drawing &= dealer_totals < blackjack.STAND_ON_SOFT
+    while drawing.any():
+        indexes = rows[drawing]
+        cards = decks[indexes, position[indexes]]
+        position[indexes] += 1
+        dealer_hard[indexes] += cards
+        dealer_aces[indexes] |= cards == 1
+
+        dealer_totals, _ = count_totals(dealer_hard, dealer_aces)
+        drawing &= dealer_totals < blackjack.STAND_ON_SOFT
+
+    return count_outcomes(player_totals, dealer_totals, player_blackjack,
+                          dealer_blackjack, blackjack_pays)
+
+
+def count_outcomes(player_totals, dealer_totals, player_blackjack,
+                   dealer_blackjack, blackjack_pays=simulator.BLACKJACK_PAYS):
+    """Resolve hands by totals and BLACKJACKS and count outcomes."""
+    player_exceed = player_totals > blackjack.WIN_SCORE
+    dealer_exceed = dealer_totals > blackjack.WIN_SCORE
+    any_blackjack = player_blackjack | dealer_blackjack
+
+    # Resolve as the game does: BLACKJACKS first, then by totals
+    push = np.where(any_blackjack, player_blackjack & dealer_blackjack,
+                    ((player_totals == dealer_totals) & ~player_exceed) |
+                    (player_exceed & dealer_exceed))
+    win = ~push & np.where(any_blackjack, player_blackjack,
+                           (dealer_exceed & ~player_exceed) |
+                           (~player_exceed & (player_totals > dealer_totals)))
+    loss = ~push & ~win
+    win_blackjack = win & player_blackjack
+
+    tally = Counter()
+    tally[simulator.WIN] = int(win.sum())
+    tally[simulator.PUSH] = int(push.sum())
+    tally[simulator.LOSS] = int(loss.sum())
+    tally['bust'] = int(player_exceed.sum())
+    tally['dealer_bust'] = int(dealer_exceed.sum())
+    tally['blackjack'] = int(player_blackjack.sum())
+    tally['net'] = float(win.sum() - win_blackjack.sum() - loss.sum() +
+                         blackjack_pays * win_blackjack.sum())
+    return tally
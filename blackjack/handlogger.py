@@ -0,0 +1,209 @@
+#!/usr/bin/env python3
+"""
+Compact binary log of played hands with replay.
+
+Every hand is appended as a fixed-width record: number of the hand,
+outcome, totals, number of player's hits and codes of player's and
+dealer's cards. Statistics are computed by scanning fields of the
+memory-mapped file, replay re-runs recorded hands against the engine.
+A partly written last record (e.g. after the recording was killed) is
+ignored by statistics and replay, and cut off before new hands are
+appended.
+"""
+import argparse
+import mmap
+import os
+import random
+import struct
+from collections import Counter
+
+import blackjack
+import simulator
+
+# Define max cards in a hand (21 aces and a card exceeding 21)
+MAX_CARDS = 22
+
+# Define record: hand number, outcome, player's and dealer's totals,
+# player's hits, number of player's and dealer's cards and card codes
+RECORD = struct.Struct(f'<IBBBBBB{MAX_CARDS}s{MAX_CARDS}s')
+OUTCOME_OFFSET = 4
+PLAYER_TOTAL_OFFSET = 5
+DEALER_TOTAL_OFFSET = 6
+HITS_OFFSET = 7
+
+# Define codes of outcomes in records
+OUTCOMES = (simulator.WIN, simulator.PUSH, simulator.LOSS)
+
+
+def main():
+    """Record simulated hands, show statistics of the log or replay it."""
+    parser = argparse.ArgumentParser(
+        description='Record, show statistics or replay the log of hands.')
+    parser.add_argument('command', choices=('record', 'stats', 'replay'),
+                        help='simulate and record, scan statistics '
+                             'or replay hands')
+    parser.add_argument('path', help='log file')
+    parser.add_argument('-n', '--hands', type=int, default=simulator.HANDS,
+                        help=f'hands to record (default {simulator.HANDS})')
+    parser.add_argument('-p', '--policy', choices=sorted(simulator.POLICIES),
+                        default='basic', help='player policy')
+    parser.add_argument('-d', '--decks', type=int, default=1,
+                        help='number of decks in shoe (default 1)')
+    parser.add_argument('-s', '--seed', type=int,
+                        help='seed of random generator')
+    args = parser.parse_args()
+
+    if args.command == 'record':
+        rng = None if args.seed is None else random.Random(args.seed)
+        with HandLog(args.path) as log:
+            if log.truncated:
+                print(f'Partial last record ({log.truncated} bytes) '
+                      'is cut off.')
+            simulator.simulate(args.hands, simulator.POLICIES[args.policy],
+                               args.decks, rng=rng, log=log)
+        print(f'{args.hands} hands are appended to {args.path}.')
+        return
+
+    partial = os.path.getsize(args.path) % RECORD.size
+    if partial:
+        print(f'Partial last record ({partial} bytes) is ignored.')
+
+    if args.command == 'stats':
+        show_log_stats(scan_log(args.path))
+    else:
+        hands, mismatches = replay_log(args.path)
+        print(f'Replayed hands: {hands}, mismatches: {len(mismatches)}')
+        for number in mismatches[:10]:
+            print(f'- hand #{number}')
+
+
+class HandLog:
+    """Binary log of hands opened for appending."""
+
+    def __init__(self, path):
+        """Open log file, new hands are numbered after existing ones."""
+        self.file = open(path, 'ab')
+
+        # Cut off partial last record, so new records stay aligned
+        size = self.file.tell()
+        whole = whole_size(size)
+        if whole != size:
+            self.file.truncate(whole)
+        self.truncated = size - whole
+        self.hands = whole // RECORD.size
+
+    def __enter__(self):
+        """Return the log."""
+        return self
+
+    def __exit__(self, *exc_info):
+        """Close the log."""
+        self.close()
+
+    def log_hand(self, outcome, player_hand, dealer_hand):
+        """Append record of the played hand."""
+        if len(player_hand) > MAX_CARDS or len(dealer_hand) > MAX_CARDS:
+            raise ValueError('Too many cards for a record')
+
+        # Player takes all cards after pocket ones by hits
+        self.file.write(RECORD.pack(
+            self.hands, OUTCOMES.index(outcome),
+            player_hand.total, dealer_hand.total,
+            len(player_hand) - 2, len(player_hand), len(dealer_hand),
+            bytes(player_hand), bytes(dealer_hand)))
+        self.hands += 1
+
+    def close(self):
+        """Flush and close the log file."""
+        self.file.close()
+
+
+def whole_size(size):
+    """Return size of whole records in the size (partial record is cut)."""
+    return size - size % RECORD.size
+
+
+def read_records(path):
+    """Yield unpacked records: number, outcome, hits and both hands."""
+    with open(path, 'rb') as file, map_file(file) as data:
+        for offset in range(0, whole_size(len(data)), RECORD.size):
+            (number, outcome, _, _, hits, player_cards, dealer_cards,
+             player_hand, dealer_hand) = RECORD.unpack_from(data, offset)
+            yield (number, OUTCOMES[outcome], hits,
+                   list(player_hand[:player_cards]),
+                   list(dealer_hand[:dealer_cards]))
+
+
+def map_file(file):
+    """Memory-map the whole file for reading (empty bytes if empty)."""
+    if not os.fstat(file.fileno()).st_size:
+        return memoryview(b'')
+    return mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+
+def scan_log(path):
+    """Return Counter of statistics by scanning fields of records."""
+    with open(path, 'rb') as file, map_file(file) as data:
+        # Slices with step of record size take one field of every record
+        # (partial last record is left out)
+        end = whole_size(len(data))
+        outcomes = Counter(data[OUTCOME_OFFSET:end:RECORD.size])
+        player_totals = Counter(data[PLAYER_TOTAL_OFFSET:end:RECORD.size])
+        dealer_totals = Counter(data[DEALER_TOTAL_OFFSET:end:RECORD.size])
+        hits = sum(data[HITS_OFFSET:end:RECORD.size])
+
+    stats = Counter({outcome: outcomes[code]
+                     for code, outcome in enumerate(OUTCOMES)})
+    stats['hands'] = sum(outcomes.values())
+    stats['hits'] = hits
+    stats['bust'] = sum(number for total, number in player_totals.items()
+                        if total > blackjack.WIN_SCORE)
+    stats['dealer_bust'] = sum(number for total, number in
+                               dealer_totals.items()
+                               if total > blackjack.WIN_SCORE)
+    return stats
+
+
+def replay_hand(hits, player_hand, dealer_hand):
+    """Play the hand again with recorded cards and decisions."""
+    # Cards are dealt in order: pocket cards by turns, player's, dealer's
+    dealt = [player_hand[0], dealer_hand[0], player_hand[1], dealer_hand[1]]
+    dealt += player_hand[2:] + dealer_hand[2:]
+    card_deck = dealt[::-1]
+    decisions = iter([blackjack.HIT] * hits)
+
+    def replay_policy(player_total, is_soft, dealer_value):
+        """Repeat recorded decisions."""
+        return next(decisions, blackjack.STAND)
+
+    return simulator.play_hand(card_deck, replay_policy)
+
+
+def replay_log(path):
+    """Replay all hands, return their number and numbers of mismatches."""
+    hands = 0
+    mismatches = []
+
+    for number, outcome, hits, player_hand, dealer_hand in read_records(path):
+        hands += 1
+        replayed, player_replay, dealer_replay = replay_hand(
+            hits, player_hand, dealer_hand)
+        if (replayed != outcome or list(player_replay) != player_hand or
+                list(dealer_replay) != dealer_hand):
+            mismatches.append(number)
+
+    return hands, mismatches
+
+
+def show_log_stats(stats):
+    """Print statistics of logged hands."""
+    hands = stats['hands']
+
+    print(f'Logged hands: {hands}')
+    for key in (*OUTCOMES, 'bust', 'dealer_bust', 'hits'):
+        rate = stats[key] / hands if hands else 0.0
+        print(f'- {key:<12}{stats[key]:>12} ({rate:.2%})')
+
+
+if __name__ == '__main__':
+    main()
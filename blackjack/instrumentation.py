@@ -0,0 +1,170 @@
+#!/usr/bin/env python3
+"""
+Opt-in instrumentation of the blackjack engine's hot path.
+
+When enabled, deal_card() of the game module, Hand.append() (which scores
+hands) and player's and dealer's loops of the simulator are replaced
+by wrappers counting calls, cumulative time and cards dealt per phase
+(pocket cards, player's, dealer's).
+When disabled, original functions are restored, so the engine runs
+without any overhead. The simulation can also be run under cProfile
+(or an external profiler, e.g. pyinstrument instrumentation.py).
+"""
+import argparse
+import cProfile
+import pstats
+import random
+import time
+from collections import Counter
+from contextlib import contextmanager
+
+import blackjack
+import simulator
+
+# Define instrumented functions by modules (or classes) and phases of dealing
+HOOKS = ((blackjack, 'deal_card'), (blackjack.Hand, 'append'),
+         (simulator, 'play_player'), (simulator, 'play_dealer'))
+PHASES = {'play_player': 'player', 'play_dealer': 'dealer'}
+POCKET = 'pocket'
+
+# Original functions while instrumentation is enabled
+_originals = {}
+
+
+def main():
+    """Run instrumented or profiled simulation and show the report."""
+    parser = argparse.ArgumentParser(
+        description='Show where blackjack simulation time goes.')
+    parser.add_argument('-n', '--hands', type=int, default=simulator.HANDS,
+                        help=f'number of hands (default {simulator.HANDS})')
+    parser.add_argument('-p', '--policy', choices=sorted(simulator.POLICIES),
+                        default='basic', help='player policy')
+    parser.add_argument('-d', '--decks', type=int, default=1,
+                        help='number of decks in shoe (default 1)')
+    parser.add_argument('-s', '--seed', type=int,
+                        help='seed of random generator')
+    parser.add_argument('--profile', action='store_true',
+                        help='run under cProfile instead of hooks')
+    parser.add_argument('--no-hooks', action='store_true',
+                        help='run plain simulation (for external profilers)')
+    args = parser.parse_args()
+
+    rng = None if args.seed is None else random.Random(args.seed)
+    policy = simulator.POLICIES[args.policy]
+
+    if args.profile:
+        profile_simulation(args.hands, policy, args.decks, rng)
+    elif args.no_hooks:
+        simulator.show_report(
+            simulator.simulate(args.hands, policy, args.decks, rng=rng))
+    else:
+        with instrumented() as stats:
+            simulator.simulate(args.hands, policy, args.decks, rng=rng)
+        show_hook_stats(stats)
+
+
+class HookStats:
+    """Calls, cumulative time and dealt cards collected by the hooks."""
+
+    def __init__(self):
+        """Create empty statistics."""
+        self.calls = Counter()
+        self.times = Counter()
+        self.cards = Counter()
+        self.phase = POCKET
+
+    def reset(self):
+        """Clear collected statistics."""
+        self.__init__()
+
+
+def hook_label(owner, name):
+    """Return name of hooked function in statistics (with class name)."""
+    return f'{owner.__name__}.{name}' if isinstance(owner, type) else name
+
+
+def wrap(name, function, stats, label=None):
+    """Return wrapper of the function updating statistics."""
+    phase = PHASES.get(name)
+    label = name if label is None else label
+    clock = time.perf_counter
+
+    def hook(*args, **kwargs):
+        """Call the original function, count the call and its time."""
+        if name == 'deal_card':
+            stats.cards[stats.phase] += 1
+        if phase:
+            stats.phase = phase
+
+        start = clock()
+        try:
+            return function(*args, **kwargs)
+        finally:
+            stats.times[label] += clock() - start
+            stats.calls[label] += 1
+            if phase:
+                stats.phase = POCKET
+
+    hook.__name__ = hook.__qualname__ = name
+    hook.__doc__ = function.__doc__
+    return hook
+
+
+def enable(stats=None):
+    """Install hooks (if not installed yet) and return their statistics."""
+    if _originals:
+        raise RuntimeError('Instrumentation is already enabled')
+
+    stats = HookStats() if stats is None else stats
+    for owner, name in HOOKS:
+        function = getattr(owner, name)
+        _originals[owner, name] = function
+        setattr(owner, name,
+                wrap(name, function, stats, hook_label(owner, name)))
+
+    return stats
+
+
+def disable():
+    """Restore original functions."""
+    for (owner, name), function in _originals.items():
+        setattr(owner, name, function)
+    _originals.clear()
+
+
+@contextmanager
+def instrumented(stats=None):
+    """Enable hooks for the block and yield their statistics."""
+    stats = enable(stats)
+    try:
+        yield stats
+    finally:
+        disable()
+
+
+def profile_simulation(hands, policy, decks=1, rng=None, limit=15):
+    """Run simulation under cProfile and print the heaviest functions."""
+    profiler = cProfile.Profile()
+    tally = profiler.runcall(simulator.simulate, hands, policy, decks,
+                             rng=rng)
+    pstats.Stats(profiler).sort_stats('cumulative').print_stats(limit)
+    return tally
+
+
+def show_hook_stats(stats):
+    """Print calls and time of hooked functions, cards dealt by phase."""
+    print(f'{"Function":<14}{"Calls":>12}{"Time, s":>10}{"Per call, us":>14}')
+    for owner, name in HOOKS:
+        label = hook_label(owner, name)
+        calls = stats.calls[label]
+        per_call = stats.times[label] / calls * 1e6 if calls else 0.0
+        print(f'{label:<14}{calls:>12}{stats.times[label]:>10.3f}'
+              f'{per_call:>14.3f}')
+
+    print('Cards dealt by phase:')
+    for phase in (POCKET, *PHASES.values()):
+        print(f'- {phase:<8}{stats.cards[phase]:>12}')
+
+
+if __name__ == '__main__':
+    main()
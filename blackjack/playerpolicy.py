@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+"""
+Player's policies deciding batches of hands at once.
+
+A policy gets arrays of player's totals, soft flags and values of dealer's
+up-cards of all pending hands and returns array of choices (HIT or STAND),
+so vectorized or table-driven strategies decide thousands of hands
+by one call. Policies are also callable for one decision, like functions
+of the simulator's policies.
+"""
+import argparse
+from abc import ABC, abstractmethod
+from collections import Counter
+
+import numpy as np
+
+import blackjack
+import handevaluator
+import simulator
+import strategysolver
+
+# Define default number of hands in a batch
+BATCH = 100_000
+
+
+def main():
+    """Run batch simulation with a policy and show the report."""
+    parser = argparse.ArgumentParser(
+        description='Simulate blackjack hands in batches.')
+    parser.add_argument('-n', '--hands', type=int, default=simulator.HANDS,
+                        help=f'number of hands (default {simulator.HANDS})')
+    parser.add_argument('-p', '--policy', choices=sorted(POLICIES),
+                        default='basic', help='player policy')
+    parser.add_argument('-b', '--batch', type=int, default=BATCH,
+                        help=f'hands in a batch (default {BATCH})')
+    parser.add_argument('-s', '--seed', type=int,
+                        help='seed of random generator')
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(args.seed)
+    policy = POLICIES[args.policy]()
+    tally = simulate(args.hands, policy, args.batch, rng)
+    simulator.show_report(tally)
+
+
+class Policy(ABC):
+    """Base of player's policies deciding batches of hands."""
+
+    @abstractmethod
+    def decide(self, totals, softs, up_values):
+        """Return array of HIT/STAND for arrays of pending hands."""
+
+    def __call__(self, player_total, is_soft, dealer_value):
+        """Decide one hand (as the simulator's policy)."""
+        choices = self.decide(np.array([player_total]), np.array([is_soft]),
+                              np.array([dealer_value]))
+        return int(choices[0])
+
+
+class ThresholdPolicy(Policy):
+    """Hit while total is less than thresholds for hard and soft hands."""
+
+    def __init__(self, hard_stand=blackjack.STAND_ON_SOFT,
+                 soft_stand=blackjack.STAND_ON_SOFT):
+        """Set totals to stand on hard and soft hands."""
+        self.hard_stand = hard_stand
+        self.soft_stand = soft_stand
+
+    def decide(self, totals, softs, up_values):
+        """Return HIT where total is less than threshold."""
+        thresholds = np.where(softs, self.soft_stand, self.hard_stand)
+        return np.where(totals < thresholds, blackjack.HIT, blackjack.STAND)
+
+
+class TablePolicy(Policy):
+    """Decide by table of (total, soft flag, dealer's up-card)."""
+
+    def __init__(self, table=None):
+        """Convert table of decisions to array (basic strategy by default)."""
+        table = strategysolver.get_table() if table is None else table
+
+        # Totals missing in the table (over 21) stand
+        self.choices = np.full((blackjack.WIN_SCORE + 1, 2, 11),
+                               blackjack.STAND, dtype=np.int8)
+        for (total, is_soft, up_value), choice in table.items():
+            self.choices[total, int(is_soft), up_value] = choice
+
+    def decide(self, totals, softs, up_values):
+        """Look up decisions of all hands at once."""
+        return self.choices[totals, np.asarray(softs, dtype=np.intp),
+                            up_values]
+
+
+class FunctionPolicy(Policy):
+    """Adapter of simulator's policy function deciding hand by hand."""
+
+    def __init__(self, function):
+        """Set function of (total, soft flag, up-card value)."""
+        self.function = function
+
+    def decide(self, totals, softs, up_values):
+        """Call the function for every hand."""
+        return np.fromiter(
+            (self.function(int(total), bool(is_soft), int(up_value))
+             for total, is_soft, up_value in zip(totals, softs, up_values)),
+            dtype=np.int8, count=len(totals))
+
+
+# Policies by names (factories of policies)
+POLICIES = {'basic': TablePolicy,
+            'dealer': ThresholdPolicy,
+            'safe': lambda: ThresholdPolicy(12, blackjack.WIN_SCORE),
+            'stand': lambda: ThresholdPolicy(0, 0)}
+
+
+def simulate(hands, policy, batch=BATCH, rng=None):
+    """Play hands by batches and merge their outcomes."""
+    tally = Counter()
+
+    for start in range(0, hands, batch):
+        tally.update(handevaluator.simulate_batch(
+            min(batch, hands - start), policy, rng))
+
+    return tally
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+"""
+Explorer of house edge by rule variants.
+
+Sweeps all combinations of dealer's rule on soft 17 (S17 or H17),
+number of decks and BLACKJACK payout, simulates every variant
+with the basic strategy and prints the house edge table.
+Finished variants are kept in the cache file by rule set and number
+of hands, so repeated sweeps compute only missing ones.
+"""
+import argparse
+import json
+import os
+
+import cardshoe
+import simrunner
+import simulator
+
+# Define swept rules: dealer's rules on soft 17, decks and payouts
+DEALER_RULES = {'S17': False, 'H17': True}
+DECKS = (1, 2, 4, 6, 8)
+PAYOUTS = {'3:2': 1.5, '6:5': 1.2}
+
+# Define default cache file
+CACHE = 'variants_cache.json'
+
+
+def main():
+    """Sweep rule variants and show the house edge table."""
+    parser = argparse.ArgumentParser(
+        description='Compute house edge for blackjack rule variants.')
+    parser.add_argument('-n', '--samples', type=int, default=simulator.HANDS,
+                        help='hands per variant '
+                             f'(default {simulator.HANDS})')
+    parser.add_argument('-d', '--decks', type=int, nargs='+', default=DECKS,
+                        help='numbers of decks (default 1 2 4 6 8)')
+    parser.add_argument('-w', '--workers', type=int, default=os.cpu_count(),
+                        help='number of worker processes')
+    parser.add_argument('-s', '--seed', type=int, default=0,
+                        help='seed of random generators (default 0)')
+    parser.add_argument('--cache', default=CACHE,
+                        help=f'cache file of results (default {CACHE})')
+    args = parser.parse_args()
+
+    edges = explore_rules(args.samples, args.decks, args.cache,
+                          args.workers, args.seed)
+    show_edges(edges, args.decks)
+
+
+def variant_key(dealer_rule, decks, payout, samples):
+    """Return cache key of the variant and number of hands."""
+    return f'{dealer_rule}-{decks}-{payout}/{samples}'
+
+
+def load_cache(path):
+    """Return cached house edges by keys (empty if no cache file)."""
+    try:
+        with open(path, encoding='utf-8') as file:
+            return json.load(file)
+    except FileNotFoundError:
+        return {}
+
+
+def save_cache(cache, path):
+    """Write cached house edges to the file."""
+    with open(path, 'w', encoding='utf-8') as file:
+        json.dump(cache, file, indent=1, sort_keys=True)
+
+
+def simulate_rules(hands, decks, hit_soft_17, blackjack_pays, rng=None):
+    """Play hands of the variant with the basic strategy."""
+    return simulator.simulate(hands, simulator.POLICIES['basic'], decks,
+                              cardshoe.PENETRATION, rng=rng,
+                              hit_soft_17=hit_soft_17,
+                              blackjack_pays=blackjack_pays)
+
+
+def explore_rules(samples, decks=DECKS, path=CACHE, workers=None, seed=0):
+    """
+    Return house edges by (dealer's rule, decks, payout) of all variants.
+
+    Missing variants are simulated and saved to the cache one by one,
+    so an interrupted sweep keeps finished ones.
+    """
+    cache = load_cache(path)
+    edges = {}
+
+    for dealer_rule, hit_soft_17 in DEALER_RULES.items():
+        for number in decks:
+            for payout, blackjack_pays in PAYOUTS.items():
+                key = variant_key(dealer_rule, number, payout, samples)
+                if key not in cache:
+                    tally = simrunner.run_parallel(
+                        simulate_rules, samples, number, hit_soft_17,
+                        blackjack_pays, workers=workers, seed=seed)
+                    cache[key] = -tally['net'] / samples
+                    save_cache(cache, path)
+                edges[dealer_rule, number, payout] = cache[key]
+
+    return edges
+
+
+def show_edges(edges, decks=DECKS):
+    """Print house edge table: rows by decks, columns by rules."""
+    columns = [(dealer_rule, payout) for dealer_rule in DEALER_RULES
+               for payout in PAYOUTS]
+
+    print('House edge by rule variants (basic strategy):')
+    print(f'{"Decks":>5}' + ''.join(f'{rule + " " + payout:>12}'
+                                    for rule, payout in columns))
+    for number in decks:
+        print(f'{number:>5}' + ''.join(
+            f'{edges[rule, number, payout]:>+12.2%}'
+            for rule, payout in columns))
+
+
+if __name__ == '__main__':
+    main()
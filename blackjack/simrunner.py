@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""
+Run blackjack simulation in a pool of processes.
+
+Every worker plays a fixed share of hands with its own random generator
+seeded from the common seed and the worker's index, so the merged report
+is the same for the same seed and number of workers.
+"""
+import argparse
+import os
+import random
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+
+import simulator
+
+
+def main():
+    """Run parallel simulation and show the report."""
+    parser = argparse.ArgumentParser(
+        description='Simulate blackjack hands in parallel.')
+    parser.add_argument('-n', '--hands', type=int, default=simulator.HANDS,
+                        help=f'number of hands (default {simulator.HANDS})')
+    parser.add_argument('-p', '--policy', choices=sorted(simulator.POLICIES),
+                        default='dealer', help='player policy')
+    parser.add_argument('-d', '--decks', type=int, default=1,
+                        help='number of decks in shoe (default 1)')
+    parser.add_argument('-c', '--penetration', type=float, default=0,
+                        help='part of shoe dealt before reshuffle (default 0)')
+    parser.add_argument('-w', '--workers', type=int, default=os.cpu_count(),
+                        help='number of worker processes')
+    parser.add_argument('-s', '--seed', type=int, default=0,
+                        help='seed of random generators (default 0)')
+    args = parser.parse_args()
+
+    tally = run_parallel(simulator.simulate, args.hands,
+                         simulator.POLICIES[args.policy],
+                         args.decks, args.penetration,
+                         workers=args.workers, seed=args.seed)
+    simulator.show_report(tally)
+
+
+def split_hands(hands, workers):
+    """Split number of hands to fixed shares of workers."""
+    share, rest = divmod(hands, workers)
+    return [share + 1 if index < rest else share for index in range(workers)]
+
+
+def worker_seed(seed, index):
+    """Create seed of worker's random generator."""
+    # String seeds are hashed by SHA-512, so streams are independent
+    return f'blackjack/{seed}/{index}'
+
+
+def run_worker(task, hands, args, seed, index):
+    """Run task with worker's own random generator."""
+    rng = random.Random(worker_seed(seed, index))
+    return task(hands, *args, rng=rng)
+
+
+def run_parallel(task, hands, *args, workers=None, seed=0):
+    """
+    Run task(hands, *args, rng=rng) in pool of processes and merge tallies.
+
+    Task (module-level function) should return Counter of its results.
+    """
+    workers = workers or os.cpu_count()
+    tally = Counter()
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = [executor.submit(run_worker, task, share, args, seed, index)
+                   for index, share in enumerate(split_hands(hands, workers))]
+
+        # Merge tallies in order of workers
+        for future in futures:
+            tally.update(future.result())
+
+    return tally
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,207 @@
+#!/usr/bin/env python3
+"""
+Headless Monte Carlo simulation of the blackjack game.
+
+Plays many hands by the rules of the game without any input or output,
+the player's choice is made by a policy instead of the user.
+Hands are dealt from a card shoe (by default a new deck for every hand).
+Reports win/push/loss/bust rates of all simulated hands.
+"""
+import argparse
+import random
+from collections import Counter
+
+import blackjack
+import cardshoe
+import strategysolver
+
+# Define outcomes of the hand
+WIN = 'win'
+PUSH = 'push'
+LOSS = 'loss'
+
+# Define payout of player's BLACKJACK (3:2)
+BLACKJACK_PAYS = 1.5
+
+# Define default number of simulated hands
+HANDS = 100_000
+
+
+def main():
+    """Run simulation and show the report."""
+    parser = argparse.ArgumentParser(description='Simulate blackjack hands.')
+    parser.add_argument('-n', '--hands', type=int, default=HANDS,
+                        help=f'number of hands (default {HANDS})')
+    parser.add_argument('-p', '--policy', choices=sorted(POLICIES),
+                        default='dealer', help='player policy')
+    parser.add_argument('-d', '--decks', type=int, default=1,
+                        help='number of decks in shoe (default 1)')
+    parser.add_argument('-c', '--penetration', type=float, default=0,
+                        help='part of shoe dealt before reshuffle (default 0)')
+    parser.add_argument('-s', '--seed', type=int,
+                        help='seed of random generator')
+    args = parser.parse_args()
+
+    rng = None if args.seed is None else random.Random(args.seed)
+    tally = simulate(args.hands, POLICIES[args.policy],
+                     args.decks, args.penetration, rng)
+    show_report(tally)
+
+
+def mimic_dealer(player_total, is_soft, dealer_value):
+    """Hit while total is less than 17 (as dealer does)."""
+    if player_total < blackjack.STAND_ON_SOFT:
+        return blackjack.HIT
+    return blackjack.STAND
+
+
+def never_bust(player_total, is_soft, dealer_value):
+    """Hit only while another card can not exceed 21."""
+    if player_total < 12 or is_soft:
+        return blackjack.HIT
+    return blackjack.STAND
+
+
+def always_stand(player_total, is_soft, dealer_value):
+    """Never take another card."""
+    return blackjack.STAND
+
+
+# Policies by names - functions of (player's total, soft flag,
+# value of dealer's face up card) returning HIT or STAND
+POLICIES = {'dealer': mimic_dealer,
+            'safe': never_bust,
+            'basic': strategysolver.basic_strategy,
+            'stand': always_stand}
+
+
+def simulate(hands, policy, decks=1, penetration=0, rng=None, log=None,
+             hit_soft_17=False, blackjack_pays=BLACKJACK_PAYS):
+    """Play hands from one card shoe and count outcomes (log if given)."""
+    tally = Counter()
+    shoe = cardshoe.Shoe(decks, penetration, rng)
+
+    for _ in range(hands):
+        shoe.start_round()
+        outcome, player_hand, dealer_hand = play_hand(shoe, policy,
+                                                      hit_soft_17)
+        tally[outcome] += 1
+        tally['net'] += hand_payout(outcome, player_hand, blackjack_pays)
+        if log is not None:
+            log.log_hand(outcome, player_hand, dealer_hand)
+
+        if blackjack.check_exceeding(player_hand):
+            tally['bust'] += 1
+        if blackjack.check_exceeding(dealer_hand):
+            tally['dealer_bust'] += 1
+        if len(player_hand) == 2 and blackjack.check_blackjack(player_hand):
+            tally['blackjack'] += 1
+
+    return tally
+
+
+def play_hand(card_deck, policy, hit_soft_17=False):
+    """Play one hand and return outcome with player's and dealer's hands."""
+    player_hand = blackjack.Hand()
+    dealer_hand = blackjack.Hand()
+
+    # Deal first two cards
+    for _ in range(2):
+        player_hand.append(blackjack.deal_card(card_deck))
+        dealer_hand.append(blackjack.deal_card(card_deck))
+
+    # If BLACKJACK, the hand finishes
+    player_blackjack = blackjack.check_blackjack(player_hand)
+    dealer_blackjack = blackjack.check_blackjack(dealer_hand)
+
+    if player_blackjack and dealer_blackjack:
+        return PUSH, player_hand, dealer_hand
+    elif player_blackjack:
+        return WIN, player_hand, dealer_hand
+    elif dealer_blackjack:
+        return LOSS, player_hand, dealer_hand
+
+    # Player hits or stands, dealer draws only if player does not exceed 21
+    player_total = play_player(player_hand, dealer_hand[0], card_deck, policy)
+    dealer_total = dealer_hand.total
+
+    if player_total <= blackjack.WIN_SCORE:
+        dealer_total = play_dealer(dealer_hand, card_deck, hit_soft_17)
+
+    return resolve_hand(player_total, dealer_total), player_hand, dealer_hand
+
+
+def play_player(player_hand, dealer_card, card_deck, policy):
+    """Take cards while policy hits and return player's total."""
+    player_total = player_hand.total
+
+    while player_total < blackjack.WIN_SCORE:
+        is_soft = blackjack.check_soft(player_hand)
+        dealer_value = blackjack.CARD_VALUES[dealer_card]
+        if policy(player_total, is_soft, dealer_value) != blackjack.HIT:
+            break
+
+        player_hand.append(blackjack.deal_card(card_deck))
+        player_total = player_hand.total
+
+    return player_total
+
+
+def play_dealer(dealer_hand, card_deck, hit_soft_17=False):
+    """Take cards while dealer's total is less than 17 (S17 or H17 rule)."""
+    dealer_total = dealer_hand.total
+
+    while (dealer_total < blackjack.STAND_ON_SOFT or
+           hit_soft_17 and blackjack.check_s17(dealer_hand)):
+        dealer_hand.append(blackjack.deal_card(card_deck))
+        dealer_total = dealer_hand.total
+
+    return dealer_total
+
+
+def resolve_hand(player_total, dealer_total):
+    """Compare totals and return outcome of the hand for player."""
+    player_exceed = player_total > blackjack.WIN_SCORE
+    dealer_exceed = dealer_total > blackjack.WIN_SCORE
+
+    if player_total == dealer_total and not player_exceed:
+        return PUSH
+    elif player_exceed and dealer_exceed:
+        return PUSH
+    elif dealer_exceed:
+        return WIN
+    elif player_exceed:
+        return LOSS
+    elif player_total > dealer_total:
+        return WIN
+    else:
+        return LOSS
+
+
+def hand_payout(outcome, player_hand, blackjack_pays=BLACKJACK_PAYS):
+    """Return player's net result of the hand in units of bet."""
+    if outcome == WIN:
+        if len(player_hand) == 2 and blackjack.check_blackjack(player_hand):
+            return blackjack_pays
+        return 1
+    elif outcome == LOSS:
+        return -1
+    else:
+        return 0
+
+
+def show_report(tally):
+    """Print numbers and rates of simulated outcomes."""
+    hands = tally[WIN] + tally[PUSH] + tally[LOSS]
+
+    print(f'Simulated hands: {hands}')
+    for key in (WIN, PUSH, LOSS, 'bust', 'dealer_bust', 'blackjack'):
+        rate = tally[key] / hands if hands else 0.0
+        print(f'- {key:<12}{tally[key]:>12} ({rate:.2%})')
+
+    edge = tally['net'] / hands if hands else 0.0
+    print(f'Player\'s edge: {edge:+.3%} of bet')
+
+
+if __name__ == '__main__':
+    main()
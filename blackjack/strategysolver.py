@@ -0,0 +1,161 @@
+#!/usr/bin/env python3
+"""
+Basic strategy (HIT or STAND) for the rules of the game.
+
+Expected values of hitting and standing are computed for every player's
+total, soft flag and dealer's up-card (no splitting, S17 rule,
+player exceeding 21 loses at once). Decisions are precomputed
+to a table which is read by a lookup for every decision.
+"""
+import argparse
+import json
+from functools import lru_cache
+
+import blackjack
+import dealersolver
+
+# Define player's totals in the table (soft totals are 12-21)
+HARD_TOTALS = range(4, 22)
+SOFT_TOTALS = range(12, 22)
+
+
+def main():
+    """Show the table of basic strategy and save it if needed."""
+    parser = argparse.ArgumentParser(
+        description='Compute basic strategy (HIT or STAND).')
+    parser.add_argument('-d', '--decks', type=int, default=1,
+                        help='number of decks in shoe (default 1)')
+    parser.add_argument('-o', '--output',
+                        help='save the table to JSON file')
+    args = parser.parse_args()
+
+    table = build_table(args.decks)
+    show_table(table)
+
+    if args.output:
+        save_table(table, args.output)
+        print(f'The table is saved to {args.output}.')
+
+
+def stand_value(player_total, distribution):
+    """Return expected value of standing on player's total."""
+    value = distribution[dealersolver.BUST]
+
+    for outcome in dealersolver.OUTCOMES[:-1]:
+        if player_total > outcome:
+            value += distribution[outcome]
+        elif player_total < outcome:
+            value -= distribution[outcome]
+
+    return value
+
+
+def add_value(player_total, is_soft, value):
+    """Return player's total and soft flag after taking a card of value."""
+    player_total += value
+
+    # Count an ace as 11 or as 1 if the total exceeds 21
+    if value == 1 and not is_soft and player_total + 10 <= blackjack.WIN_SCORE:
+        return player_total + 10, True
+    if is_soft and player_total > blackjack.WIN_SCORE:
+        return player_total - 10, False
+
+    return player_total, is_soft
+
+
+def solve_up_card(up_value, counts):
+    """Return dict of (total, soft) with expected values of HIT and STAND."""
+    # Dealer has no BLACKJACK, else the hand is already over
+    distribution = dealersolver.dealer_distribution(up_value, counts, True)
+    remaining = sum(counts)
+
+    @lru_cache(maxsize=None)
+    def best_value(player_total, is_soft):
+        """Return expected value of the best decision from the state."""
+        if player_total > blackjack.WIN_SCORE:
+            return -1.0
+        if player_total == blackjack.WIN_SCORE:
+            return stand_value(player_total, distribution)
+
+        return max(hit_value(player_total, is_soft),
+                   stand_value(player_total, distribution))
+
+    def hit_value(player_total, is_soft):
+        """Return expected value of taking another card and playing on."""
+        value = 0.0
+        for card_value in dealersolver.CARD_RANGE:
+            count = counts[card_value - 1]
+            if count:
+                value += count / remaining * best_value(
+                    *add_value(player_total, is_soft, card_value))
+
+        return value
+
+    states = [(total, False) for total in HARD_TOTALS]
+    states += [(total, True) for total in SOFT_TOTALS]
+
+    return {state: (hit_value(*state), stand_value(state[0], distribution))
+            for state in states}
+
+
+def build_table(decks=1):
+    """Return table of decisions by (total, soft flag, dealer's up-card)."""
+    table = {}
+
+    for up_value in dealersolver.CARD_RANGE:
+        # Cards of player's hand are not removed from the shoe
+        counts = dealersolver.shoe_composition(decks)
+        counts = dealersolver.remove_card(counts, up_value)
+
+        values = solve_up_card(up_value, counts)
+        for (player_total, is_soft), (hit, stand) in values.items():
+            choice = blackjack.HIT if hit > stand else blackjack.STAND
+            table[player_total, is_soft, up_value] = choice
+
+    return table
+
+
+@lru_cache(maxsize=None)
+def get_table(decks=1):
+    """Return table of basic strategy computed once for number of decks."""
+    return build_table(decks)
+
+
+def basic_strategy(player_total, is_soft, dealer_value):
+    """Hit or stand by the table of basic strategy (player policy)."""
+    return get_table()[player_total, is_soft, dealer_value]
+
+
+def save_table(table, path):
+    """Save table of decisions to JSON file."""
+    rows = [[*key, choice] for key, choice in sorted(table.items())]
+
+    with open(path, 'w') as file:
+        json.dump(rows, file)
+
+
+def load_table(path):
+    """Load table of decisions from JSON file."""
+    with open(path) as file:
+        rows = json.load(file)
+
+    return {(player_total, is_soft, up_value): choice
+            for player_total, is_soft, up_value, choice in rows}
+
+
+def show_table(table):
+    """Print the table of basic strategy (H=HIT, S=STAND)."""
+    print('Total ' + ''.join(f'{"A" if up_value == 1 else up_value:>3}'
+                             for up_value in dealersolver.CARD_RANGE))
+
+    for is_soft, totals in ((False, HARD_TOTALS), (True, SOFT_TOTALS)):
+        for player_total in totals:
+            label = f'{"S" if is_soft else "H"}{player_total}'
+            print(f'{label:<6}' + ''.join(
+                '  H' if table[player_total, is_soft, up_value] ==
+                blackjack.HIT else '  S'
+                for up_value in dealersolver.CARD_RANGE))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,225 @@
+#!/usr/bin/env python3
+"""
+Asyncio TCP server hosting many blackjack tables.
+
+Every connection gets its own table with a persistent shoe.
+The table runs the rules of the game as a state machine
+(waiting for the round, player's turn, finished round; dealer draws
+when player stands). Player's choice is read with a timeout (the player
+stands if time is over), so one process serves thousands of players
+without threads.
+Try it with: nc localhost 8021
+"""
+import argparse
+import asyncio
+
+import blackjack
+import cardshoe
+import simulator
+
+# Define default address of the server and player's time to decide
+HOST = 'localhost'
+PORT = 8021
+TIMEOUT = 30
+BACKLOG = 4096
+
+# Define states of the table
+WAITING = 'waiting'
+PLAYER_TURN = 'player_turn'
+FINISHED = 'finished'
+
+# Define messages of outcomes for player
+RESULTS = {simulator.WIN: 'You win. Congratulations!',
+           simulator.PUSH: 'PUSH! Game ties.',
+           simulator.LOSS: 'Sorry, dealer wins.'}
+
+
+def main():
+    """Run the server until it is interrupted."""
+    parser = argparse.ArgumentParser(
+        description='Run multi-table BLACKJACK server.')
+    parser.add_argument('--host', default=HOST,
+                        help=f'host to listen (default {HOST})')
+    parser.add_argument('-p', '--port', type=int, default=PORT,
+                        help=f'port to listen (default {PORT})')
+    parser.add_argument('-t', '--timeout', type=float, default=TIMEOUT,
+                        help=f'seconds to decide (default {TIMEOUT})')
+    parser.add_argument('-d', '--decks', type=int, default=cardshoe.DECKS,
+                        help=f'number of decks (default {cardshoe.DECKS})')
+    args = parser.parse_args()
+
+    server = TableServer(args.timeout, args.decks)
+    try:
+        asyncio.run(server.serve(args.host, args.port))
+    except KeyboardInterrupt:
+        print('The server is stopped.')
+
+
+class GameTable:
+    """Round of the game at a table as a state machine."""
+
+    def __init__(self, shoe):
+        """Create a table waiting for the round."""
+        self.shoe = shoe
+        self.state = WAITING
+        self.player_hand = blackjack.Hand()
+        self.dealer_hand = blackjack.Hand()
+        self.outcome = None
+
+    def deal(self):
+        """Start a new round: deal pocket cards and check BLACKJACKS."""
+        if self.state == PLAYER_TURN:
+            raise RuntimeError('The round is not finished')
+
+        self.shoe.start_round()
+        self.player_hand = blackjack.Hand()
+        self.dealer_hand = blackjack.Hand()
+        self.outcome = None
+
+        for _ in range(2):
+            self.player_hand.append(blackjack.deal_card(self.shoe))
+            self.dealer_hand.append(blackjack.deal_card(self.shoe))
+
+        player_blackjack = blackjack.check_blackjack(self.player_hand)
+        dealer_blackjack = blackjack.check_blackjack(self.dealer_hand)
+
+        if player_blackjack or dealer_blackjack:
+            self.outcome = simulator.resolve_hand(
+                self.player_hand.total,
+                self.dealer_hand.total)
+            self.state = FINISHED
+        else:
+            self.state = PLAYER_TURN
+
+    def hit(self):
+        """Deal another card to player, finish the turn on 21 or more."""
+        if self.state != PLAYER_TURN:
+            raise RuntimeError('It is not player\'s turn')
+
+        self.player_hand.append(blackjack.deal_card(self.shoe))
+        if self.player_hand.total >= blackjack.WIN_SCORE:
+            self.stand()
+
+    def stand(self):
+        """Finish player's turn, dealer draws and the round is resolved."""
+        if self.state != PLAYER_TURN:
+            raise RuntimeError('It is not player\'s turn')
+
+        player_total = self.player_hand.total
+        dealer_total = self.dealer_hand.total
+
+        if player_total <= blackjack.WIN_SCORE:
+            dealer_total = simulator.play_dealer(self.dealer_hand, self.shoe)
+
+        self.outcome = simulator.resolve_hand(player_total, dealer_total)
+        self.state = FINISHED
+
+
+class TableServer:
+    """Server creating a table for every connected player."""
+
+    def __init__(self, timeout=TIMEOUT, decks=cardshoe.DECKS):
+        """Set player's time to decide and number of decks at tables."""
+        self.timeout = timeout
+        self.decks = decks
+        self.tables = 0
+        self.active = 0
+
+    async def serve(self, host=HOST, port=PORT):
+        """Listen for players until cancelled."""
+        server = await asyncio.start_server(self.handle_player, host, port,
+                                            backlog=BACKLOG)
+        print(f'BLACKJACK server is listening on {host}:{port}...')
+
+        async with server:
+            await server.serve_forever()
+
+    async def handle_player(self, reader, writer):
+        """Play rounds at a new table while player wants to."""
+        self.tables += 1
+        self.active += 1
+        table = GameTable(cardshoe.Shoe(self.decks))
+
+        try:
+            await send(writer, f'Welcome to BLACKJACK table #{self.tables}!')
+            another = blackjack.HIT
+
+            while another == blackjack.HIT:
+                await self.play_round(table, reader, writer)
+                another = await self.ask_choice(
+                    reader, writer, 'Another round? (YES=1, NO=0)')
+
+            await send(writer, 'Thanks for playing!')
+        except ConnectionError:
+            pass
+        finally:
+            self.active -= 1
+            writer.close()
+
+    async def play_round(self, table, reader, writer):
+        """Play one round at the table."""
+        table.deal()
+        await send(writer, f'Your hand: {show_cards(table.player_hand)}')
+        await send(writer, 'Dealer\'s hand: '
+                           f'{blackjack.card_name(table.dealer_hand[0])}, '
+                           'card is face down')
+
+        while table.state == PLAYER_TURN:
+            total = table.player_hand.total
+            choice = await self.ask_choice(
+                reader, writer,
+                f'Your total: {total}. Take another card (HIT=1) '
+                'or pass (STAND=0)?')
+
+            if choice == blackjack.HIT:
+                table.hit()
+                await send(writer,
+                           f'Your hand: {show_cards(table.player_hand)}')
+            else:
+                if choice is None:
+                    await send(writer, 'Time is over, you stand.')
+                table.stand()
+
+        await send(writer, f'Dealer\'s hand: {show_cards(table.dealer_hand)}')
+        await send(writer,
+                   f'Totals: yours {table.player_hand.total}, '
+                   f'dealer\'s {table.dealer_hand.total}')
+        await send(writer, RESULTS[table.outcome])
+
+    async def ask_choice(self, reader, writer, question):
+        """Ask player for 1 or 0 and return it (None if time is over)."""
+        await send(writer, question)
+
+        try:
+            return await asyncio.wait_for(read_choice(reader, writer),
+                                          self.timeout)
+        except asyncio.TimeoutError:
+            return None
+
+
+async def read_choice(reader, writer):
+    """Read player's lines until 1 or 0 is entered."""
+    while True:
+        line = await reader.readline()
+        if not line:
+            raise ConnectionError('Player has left the table')
+
+        answer = line.strip()
+        if answer in (b'0', b'1'):
+            return int(answer)
+        await send(writer, 'You should type 1 or 0 and then ENTER.')
+
+
+def show_cards(hand):
+    """Return names of hand's cards."""
+    return ', '.join(blackjack.card_name(card) for card in hand)
+
+
+async def send(writer, message):
+    """Send a line of message to player."""
+    writer.write(message.encode() + b'\n')
+    await writer.drain()
+
+
+if __name__ == '__main__':
+    main()
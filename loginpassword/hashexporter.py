@@ -0,0 +1,107 @@
+"""Generate logins and passwords for students with bcrypt hashes (1.0)."""
+import argparse
+import os
+import time
+from functools import partial
+
+import bcrypt
+
+import loginpassword
+
+# Определить глобальные константы: стоимость bcrypt по умолчанию
+# и число строк, передаваемых процессу за один раз (хеширование долгое,
+# поэтому части меньше и о ходе работы сообщается чаще).
+ROUNDS = 12
+CHUNK = 100
+
+# Допустимая стоимость bcrypt.
+MIN_ROUNDS = 4
+MAX_ROUNDS = 31
+
+
+def main():
+    """Функция генерирует логины, пароли и их хеши по списку студентов."""
+    parser = argparse.ArgumentParser(
+        description='Генерация логинов, паролей и bcrypt-хешей паролей '
+                    'обучающимся.')
+    parser.add_argument('roster',
+                        help='CSV-файл со списком студентов (столбцы: '
+                             'Ф.И.О., код, год, группа, номер, форма)')
+    parser.add_argument('-c', '--rounds', type=parse_rounds, default=ROUNDS,
+                        help=f'стоимость bcrypt от {MIN_ROUNDS} '
+                             f'до {MAX_ROUNDS} (по умолчанию {ROUNDS})')
+    parser.add_argument('-w', '--workers', type=int, default=os.cpu_count(),
+                        help='число процессов для хеширования')
+    parser.add_argument('-o', '--output',
+                        help='файл для записи (по умолчанию '
+                             'logins_ГГГГ-М-Д_bcrypt.csv)')
+    args = parser.parse_args()
+
+    # Сформировать имя файла: хеши записываются отдельно от файлов
+    # без хешей (столбцов в строках больше).
+    filename = args.output or get_filename()
+    start = time.perf_counter()
+
+    # Хеши паролей вычисляются в пуле процессов вместе с логинами
+    # и паролями, строки записываются в порядке списка.
+    hasher = partial(hash_password, rounds=args.rounds)
+    progress = partial(show_progress, start=start)
+    loginpassword.process_roster(args.roster, args.workers, hasher,
+                                 filename, progress, CHUNK)
+
+    # Сообщить о завершении программы.
+    print(f'Информация записана в файл {filename} '
+          f'за {time.perf_counter() - start:.1f} с.')
+
+
+def parse_rounds(value):
+    """
+    Функция проверяет стоимость bcrypt из командной строки.
+
+    :param value: строка с числом.
+    :return: стоимость bcrypt (int).
+    """
+    try:
+        rounds = int(value)
+    except ValueError:
+        rounds = None
+    if rounds is None or not MIN_ROUNDS <= rounds <= MAX_ROUNDS:
+        raise argparse.ArgumentTypeError(
+            f'стоимость должна быть целым числом от {MIN_ROUNDS} '
+            f'до {MAX_ROUNDS}: {value!r}')
+    return rounds
+
+
+def hash_password(password, rounds=ROUNDS):
+    """
+    Функция вычисляет хеш пароля bcrypt со случайной солью.
+
+    :param password: пароль студента,
+    :param rounds: стоимость bcrypt (логарифм числа итераций).
+    :return: хеш пароля (str).
+    """
+    return bcrypt.hashpw(password.encode(), bcrypt.gensalt(rounds)).decode()
+
+
+def get_filename():
+    """
+    Функция формирует имя CSV-файла с хешами по текущей дате.
+
+    :return: имя файла вида logins_ГГГГ-М-Д_bcrypt.csv (str).
+    """
+    return loginpassword.get_filename().replace('.csv', '_bcrypt.csv')
+
+
+def show_progress(rows, start):
+    """
+    Функция выводит число обработанных строк и скорость обработки.
+
+    :param rows: число обработанных строк,
+    :param start: время начала обработки (time.perf_counter()).
+    """
+    elapsed = time.perf_counter() - start
+    print(f'\tобработано строк: {rows} ({rows / elapsed:.1f} в секунду)')
+
+
+if __name__ == '__main__':
+    main()
@@ -1,13 +1,37 @@
 """Generate logins and passwords for students and write into CSV-files (1.0)."""
+import argparse
+import glob
+import os
 import random
 import csv
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
+from functools import lru_cache
+from itertools import islice
 
 # Определить глобальные константы.
 A_B_C = 'AaBbCcDdEeFfGgHhIiJiKkLlMmNnJjPpQqRrSsTtUuVvWwXxYyZz'
 NUMBERS = '0123456789'
 SYMBOLS = A_B_C + NUMBERS
 
+# Классы символов пароля (каждый символ входит в класс один раз).
+UPPERS = ''.join(sorted({ch for ch in A_B_C if ch.isupper()}))
+LOWERS = ''.join(sorted({ch for ch in A_B_C if ch.islower()}))
+CLASSES = {'upper': UPPERS, 'lower': LOWERS, 'digit': NUMBERS}
+ALPHABET = ''.join(CLASSES.values())
+
+# Длина пароля и минимальное число символов каждого класса в нём.
+PASSWORD_LENGTH = 8
+PASSWORD_POLICY = {'upper': 1, 'lower': 1, 'digit': 1}
+
+# Криптографически стойкий генератор случайных чисел.
+secure_random = random.SystemRandom()
+
+# Число паролей, для которых случайные байты получаются за один раз
+# при пакетной генерации.
+BATCH = 10000
+
 # Для транслитерирования используется принцип соотнесения латинских и русских
 # букв, принятый при выдаче заграничных паспортов гражданам России.
 TRANSLIT = {'а': 'a', 'б': 'b', 'в': 'v', 'г': 'g', 'д': 'd', 'е': 'e',
@@ -17,9 +41,43 @@ TRANSLIT = {'а': 'a', 'б': 'b', 'в': 'v', 'г': 'g', 'д': 'd', 'е': 'e',
             'ч': 'ch', 'ш': 'sh', 'щ': 'shch', 'ъ': 'ie', 'ы': 'y', 'ь': '',
             'э': 'e', 'ю': 'iu', 'я': 'ia', '_': '_', '-': '-'}
 
+# Таблица транслитерации для str.translate() составляется один раз.
+TRANSLIT_TABLE = str.maketrans(TRANSLIT)
+
+# Порядок столбцов в CSV-файле со списком студентов.
+FIELDS = ('fullname', 'code', 'year', 'group', 'number', 'form')
+
+# Число строк, которые накапливаются перед записью в файл
+# (и передаются процессу за один раз при параллельной обработке),
+# и число частей списка, обрабатываемых одновременно одним процессом.
+CHUNK = 1000
+WINDOW = 2
+
+# Шаблон имён ранее записанных CSV-файлов и номер столбца логина в них.
+LOGIN_FILES = 'logins_*.csv'
+LOGIN_COLUMN = 6
+
 
 def main():
     """Функция генерирует логин и пароль и сохраняет их в CSV-файле."""
+    # Получить аргументы командной строки: при указании списка студентов
+    # обработать его целиком без диалога с пользователем.
+    parser = argparse.ArgumentParser(
+        description='Генерация логинов и паролей обучающимся.')
+    parser.add_argument('-r', '--roster',
+                        help='CSV-файл со списком студентов (столбцы: '
+                             'Ф.И.О., код, год, группа, номер, форма)')
+    parser.add_argument('-w', '--workers', type=int, default=1,
+                        help='число процессов для обработки списка '
+                             '(по умолчанию 1)')
+    args = parser.parse_args()
+    if args.roster:
+        process_roster(args.roster, args.workers)
+        return
+
+    # Загрузить логины из ранее записанных файлов (один раз).
+    index = LoginIndex()
+
     # Инициализировать флаг, который будет повторять выполнение программы.
     another = 'д'
 
@@ -29,18 +87,24 @@ def main():
 
     # Запустить цикл выполнения программы.
     while another == 'д'.lower():
-        # Получить информацию о студенте.
-        information = 'Error'
-        while information == 'Error':
-            information = get_info()
-
-        # На основе полученных данных сгенерировать логин студента.
-        login = get_login(information)
+        # Получить информацию о студенте и на её основе сгенерировать
+        # логин студента (если данные нельзя транслитерировать,
+        # повторить ввод).
+        login = None
+        while login is None:
+            information = 'Error'
+            while information == 'Error':
+                information = get_info()
+
+            try:
+                login = index.add(get_login(information))
+            except ValueError as error:
+                print(f'{error}! Необходимо ввести данные заново.\n')
         print('\nСгенерированные данные:')
         print(f'\tлогин - {login}')
 
         # Сгенерировать корректный пароль студента.
-        password = get_password(A_B_C, SYMBOLS)
+        password = get_password()
         print(f'\tпароль - {password}')
 
         # Записать информацию в CVS-файл.
@@ -72,33 +136,21 @@ def get_info():
     - form - форма обучения.
     :return: information - запрошенная информация в виде словаря (dict).
     """
-    # Получить данные о студенте и проверить их на корректность ввода.
+    # Получить данные о студенте и проверить каждое поле сразу после ввода.
     try:
-        fullname = input('\nВведите Ф.И.О. студента (при наличии): ').strip()
-        assert type(fullname) == str and (2 <= len(fullname.split()) <= 3)
-
-        code = input('Введите буквенный код направления подготовки \
-(специальности): ').strip()
-        assert len(code) > 0
-
-        year = input('Введите год поступления студента (4 цифры): ').strip()
-        assert len(year) == 4
-        check_year = int(year)
-        assert 1950 < check_year < 2025
-
-        group = input('Введите цифрой номер учебной группы: ').strip()
-        assert len(group) > 0
-        check_group = int(group)
-        group = str(check_group)
-
-        number = input('Введите исходный номер студента \
-в учебной группе: ').strip()
-        assert len(group) > 0
-        check_number = int(number)
-        number = str(check_number)
-
-        form = input('Введите форму обучения (1=очное, 2=заочное): ').strip()
-        assert len(code) > 0 and form in '12'
+        fullname = check_fullname(
+            input('\nВведите Ф.И.О. студента (при наличии): '))
+        code = check_code(input('Введите буквенный код направления \
+подготовки (специальности): '))
+        year = check_year(
+            input('Введите год поступления студента (4 цифры): '))
+        group = check_number(
+            input('Введите цифрой номер учебной группы: '),
+            'номер учебной группы')
+        number = check_number(input('Введите исходный номер студента \
+в учебной группе: '), 'номер студента')
+        form = check_form(
+            input('Введите форму обучения (1=очное, 2=заочное): '))
 
         # Преобразовать данные в словарь.
         information = {'fullname': fullname,
@@ -107,15 +159,272 @@ def get_info():
                        'group': group,
                        'number': number,
                        'form': form}
-    except (AssertionError, ValueError):
+    except ValueError as error:
         # В случае ошибки повторить ввод данных.
-        print('Данные введены неверно! Необходимо ввести их заново.\n')
+        print(f'{error}! Необходимо ввести данные заново.\n')
         return 'Error'
     else:
         # Вернуть словарь с данными.
         return information
 
 
+def check_info(fullname, code, year, group, number, form):
+    """
+    Функция проверяет информацию о студенте и приводит её к единому виду.
+
+    Функция получает строки, введённые пользователем или прочитанные
+    из CSV-файла:
+    :param fullname: Ф.И.О. (отчество указывается при наличии),
+    :param code: буквенный код направления подготовки (специальности),
+    :param year: год поступления,
+    :param group: номер учебной группы,
+    :param number: исходный номер студента в группе,
+    :param form: форма обучения (1=очное, 2=заочное).
+    При некорректных данных вызывается ValueError.
+    :return: information - информация о студенте в виде словаря (dict).
+    """
+    # Преобразовать проверенные данные в словарь.
+    information = {'fullname': check_fullname(fullname),
+                   'code': check_code(code),
+                   'year': check_year(year),
+                   'group': check_number(group, 'номер учебной группы'),
+                   'number': check_number(number, 'номер студента'),
+                   'form': check_form(form)}
+
+    # Вернуть словарь с данными.
+    return information
+
+
+def check_fullname(fullname):
+    """
+    Функция проверяет Ф.И.О. студента (2 или 3 слова).
+
+    :param fullname: введённое Ф.И.О.
+    При некорректных данных вызывается ValueError.
+    :return: Ф.И.О. без пробелов по краям (str).
+    """
+    fullname = fullname.strip()
+    if not 2 <= len(fullname.split()) <= 3:
+        raise ValueError(f'Некорректное Ф.И.О.: {fullname!r}')
+    return fullname
+
+
+def check_code(code):
+    """
+    Функция проверяет код направления подготовки (не пустой).
+
+    :param code: введённый код.
+    При некорректных данных вызывается ValueError.
+    :return: код без пробелов по краям (str).
+    """
+    code = code.strip()
+    if not code:
+        raise ValueError('Не указан код направления подготовки')
+    return code
+
+
+def check_year(year):
+    """
+    Функция проверяет год поступления (4 цифры, не позднее текущего года).
+
+    :param year: введённый год.
+    При некорректных данных вызывается ValueError.
+    :return: год без пробелов по краям (str).
+    """
+    year = year.strip()
+    if not (len(year) == 4 and year.isdigit() and
+            1950 < int(year) <= datetime.now().year):
+        raise ValueError(f'Некорректный год поступления: {year!r}')
+    return year
+
+
+def check_number(number, name):
+    """
+    Функция проверяет номер учебной группы или студента (целое число).
+
+    :param number: введённый номер,
+    :param name: название номера для сообщения об ошибке.
+    При некорректных данных вызывается ValueError.
+    :return: номер без начальных нулей (str).
+    """
+    try:
+        return str(int(number))
+    except ValueError:
+        raise ValueError(f'Некорректный {name}: {number!r}') from None
+
+
+def check_form(form):
+    """
+    Функция проверяет форму обучения (1=очное, 2=заочное).
+
+    :param form: введённая форма обучения.
+    При некорректных данных вызывается ValueError.
+    :return: форма обучения без пробелов по краям (str).
+    """
+    form = form.strip()
+    if form not in ('1', '2'):
+        raise ValueError(f'Некорректная форма обучения: {form!r}')
+    return form
+
+
+def read_roster(path):
+    """
+    Функция построчно читает CSV-файл со списком студентов.
+
+    Столбцы файла следуют в порядке FIELDS, строка заголовка
+    (если первый столбец равен 'fullname') и пустые строки пропускаются.
+    Строки не проверяются (проверка выполняется check_row()).
+    :param path: путь к CSV-файлу.
+    :return: генератор пар (номер строки, список столбцов строки).
+    """
+    # Кодировка utf-8-sig пропускает BOM в начале файла (например,
+    # сохранённого из Excel).
+    with open(path, newline='', encoding='utf-8-sig') as file:
+        for line_number, row in enumerate(csv.reader(file), 1):
+            if not row or (line_number == 1 and row[0] == FIELDS[0]):
+                continue
+
+            yield line_number, row
+
+
+def check_row(row):
+    """
+    Функция проверяет строку CSV-файла со списком студентов.
+
+    :param row: список столбцов строки.
+    При некорректных данных вызывается ValueError.
+    :return: information - информация о студенте в виде словаря (dict).
+    """
+    if len(row) != len(FIELDS):
+        raise ValueError(f'Ожидается столбцов: {len(FIELDS)}, '
+                         f'получено: {len(row)}')
+
+    return check_info(*row)
+
+
+def process_roster(path, workers=1, hasher=None, filename=None,
+                   progress=None, chunk=CHUNK):
+    """
+    Функция генерирует логины и пароли всем студентам из CSV-файла.
+
+    Корректные строки записываются в один датированный CSV-файл
+    в порядке списка, номера некорректных строк с причинами ошибок
+    выводятся на экран.
+    :param path: путь к CSV-файлу со списком студентов,
+    :param workers: число процессов для генерации логинов и паролей,
+    :param hasher: функция хеширования пароля (хеш записывается
+    последним столбцом), должна быть определена на уровне модуля,
+    :param filename: имя файла для записи (по умолчанию - по текущей дате),
+    :param progress: функция, которой передаётся число обработанных строк
+    после каждых chunk строк и в конце обработки,
+    :param chunk: число строк, передаваемых процессу за один раз.
+    """
+    processed = 0
+    invalid = []
+
+    index = LoginIndex()
+    credentials = generate_credentials(read_roster(path), workers, hasher,
+                                       chunk)
+
+    # Открыть файл для записи (дозаписи) один раз на весь список.
+    with LoginWriter(filename) as writer:
+        for line_number, row, login, password, hashed in credentials:
+            if row is None:
+                invalid.append((line_number, login))
+            else:
+                # Уникальность логинов проверяется в основном процессе
+                # по порядку списка.
+                row += [index.add(login), password]
+                if hashed is not None:
+                    row.append(hashed)
+                writer.write_row(row)
+                processed += 1
+
+            rows = processed + len(invalid)
+            if progress is not None and rows % chunk == 0:
+                progress(rows)
+
+    # Сообщить о последней неполной части списка.
+    rows = processed + len(invalid)
+    if progress is not None and rows % chunk:
+        progress(rows)
+
+    # Сообщить о результатах обработки списка.
+    print(f'Обработано студентов: {processed}.')
+    if invalid:
+        print(f'Некорректные строки ({len(invalid)}):')
+        for line_number, error in invalid:
+            print(f'\tстрока {line_number}: {error}')
+
+
+def generate_credentials(roster, workers=1, hasher=None, chunk=CHUNK):
+    """
+    Функция-генератор выдаёт логины и пароли студентов в порядке списка.
+
+    Список делится на части по chunk строк, части проверяются
+    и обрабатываются в пуле из workers процессов (при workers=1 -
+    в текущем процессе). Одновременно в пуле находится не больше
+    WINDOW частей на процесс, так что список читается по мере обработки.
+    :param roster: пары (номер строки, список столбцов строки),
+    :param workers: число процессов,
+    :param hasher: функция хеширования пароля (или None),
+    :param chunk: число строк, передаваемых процессу за один раз.
+    :return: генератор кортежей (номер строки, столбцы с информацией
+    о студенте или None для некорректной строки, логин или причина
+    ошибки, пароль, хеш пароля или None).
+    """
+    roster = iter(roster)
+    chunks = iter(lambda: list(islice(roster, chunk)), [])
+
+    if workers == 1:
+        for rows in chunks:
+            yield from process_chunk(rows, hasher)
+        return
+
+    # Результаты выдаются в порядке частей списка: после получения
+    # результата первой из отправленных частей отправляется следующая.
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = deque(executor.submit(process_chunk, rows, hasher)
+                        for rows in islice(chunks, workers * WINDOW))
+        while futures:
+            results = futures.popleft().result()
+            for rows in islice(chunks, 1):
+                futures.append(executor.submit(process_chunk, rows, hasher))
+            yield from results
+
+
+def process_chunk(rows, hasher=None):
+    """
+    Функция проверяет часть списка и генерирует студентам логины и пароли.
+
+    Строки с некорректными данными (в том числе с символами,
+    которые нельзя транслитерировать) возвращаются без столбцов,
+    с причиной ошибки вместо логина.
+    :param rows: пары (номер строки, список столбцов строки),
+    :param hasher: функция хеширования пароля (или None).
+    :return: список кортежей (номер строки, столбцы с информацией
+    о студенте или None, логин или причина ошибки, пароль,
+    хеш пароля или None).
+    """
+    results = []
+    passwords = generate_passwords(batch=len(rows))
+
+    for line_number, row in rows:
+        try:
+            information = check_row(row)
+            login = get_login(information)
+        except ValueError as error:
+            results.append((line_number, None, str(error), None, None))
+            continue
+
+        password = next(passwords)
+        hashed = None if hasher is None else hasher(password)
+        results.append((line_number, get_student_row(information), login,
+                        password, hashed))
+
+    return results
+
+
 def get_login(information):
     """
     Функция генерирует логин на основании данных о студенте.
@@ -148,15 +457,11 @@ def get_login(information):
     else:
         name, firstname, patronymic = name
         shortname = f'{name}_{firstname[0]}{patronymic[0]}'
-    transl_name = ''
-    for ch in shortname.lower():
-        transl_name += TRANSLIT[ch]
+    transl_name = transliterate(shortname)
 
     # Преобразовать в строчные буквы и транслитерировать код направления
     # подготовки (специальности) c использованием глобального словаря.
-    transl_code = ''
-    for ch in code.lower():
-        transl_code += TRANSLIT[ch]
+    transl_code = transliterate(code)
 
     # При необходимости добавить к номеру группы и номеру студента начальный 0.
     # Также преобразовать сведения о форме обучения
@@ -172,31 +477,262 @@ def get_login(information):
     return login
 
 
-def get_password(A_B_C, SYMBOLS):
+class LoginIndex:
     """
-    Функция генерирует пароль из 8 символов.
+    Множество выданных логинов для проверки их уникальности.
+
+    Логины загружаются из ранее записанных CSV-файлов один раз,
+    новый логин проверяется за O(1). При совпадении к логину добавляется
+    суффикс _2, _3 и т. д. (первый свободный по порядку).
+    """
+
+    def __init__(self, pattern=LOGIN_FILES):
+        """
+        Загрузить логины из файлов.
+
+        :param pattern: шаблон имён CSV-файлов с логинами.
+        """
+        self.logins = set()
+        self.suffixes = {}
+
+        for filename in glob.glob(pattern):
+            with open(filename, newline='') as file:
+                self.logins.update(row[LOGIN_COLUMN]
+                                   for row in csv.reader(file)
+                                   if len(row) > LOGIN_COLUMN)
+
+    def __contains__(self, login):
+        """Проверить, выдан ли логин."""
+        return login in self.logins
+
+    def __len__(self):
+        """Вернуть число выданных логинов."""
+        return len(self.logins)
+
+    def add(self, login):
+        """
+        Добавить логин, при совпадении - с суффиксом.
+
+        :param login: сгенерированный логин.
+        :return: уникальный логин (str).
+        """
+        unique = login
+        # Продолжить с суффикса, на котором остановились для этого логина.
+        suffix = self.suffixes.get(login, 1)
+        while unique in self.logins:
+            suffix += 1
+            unique = f'{login}_{suffix}'
+
+        self.suffixes[login] = suffix
+        self.logins.add(unique)
+        return unique
+
+
+def transliterate(text):
+    """
+    Функция транслитерирует текст строчными латинскими буквами.
+
+    :param text: текст из русских букв, знаков '_' и '-'.
+    При наличии других символов вызывается ValueError.
+    :return: транслитерированный текст (str).
+    """
+    text = text.lower()
+
+    # Проверить, что все символы текста есть в глобальном словаре
+    # (str.translate() оставил бы их без изменений).
+    unknown = set(text).difference(TRANSLIT)
+    if unknown:
+        raise ValueError(f'Символы нельзя транслитерировать: '
+                         f'{"".join(sorted(unknown))!r} в {text!r}')
+
+    # Вернуть транслитерированный текст.
+    return text.translate(TRANSLIT_TABLE)
+
+
+def get_password(length=PASSWORD_LENGTH, policy=PASSWORD_POLICY,
+                 rng=secure_random):
+    """
+    Функция генерирует пароль заданной длины без повторных попыток.
 
     Первый символ пароля не может быть цифрой.
     Остальные символы - буквы (в верхнем или нижнем регистре) или цифры.
-    Для генерации пароля используются глобальные константы:
-    :param A_B_C: прописные и с рочные латинские буквы,
-    :param SYMBOLS: латинские буквы и цифры от 0 до 9.
+    Символы требуемых классов выбираются сразу, остальные - из всех
+    классов, затем символы перемешиваются криптографически стойким
+    генератором.
+    :param length: длина пароля,
+    :param policy: минимальное число символов каждого класса
+    ('upper', 'lower', 'digit'),
+    :param rng: генератор с методами choice(), shuffle() и randrange()
+    (random.SystemRandom или BytePool).
     :return: password - возращается сгенерированный пароль (str).
     """
-    # Сгенерировать пароль в цикле с использованием глобальных констант
-    # (пока не будет удовлетворены все условия к формированию пароля).
-    repeat = True
-    password = ''
-    while repeat:
-        password = ''
-        password += A_B_C[random.randint(0, 51)]
-        for _ in range(7):
-            password += SYMBOLS[random.randint(0, 61)]
-
-        repeat = check_password(password)
+    # Проверить, что пароль заданной длины может удовлетворить требованиям.
+    required = check_policy(length, policy)
+
+    # Выбрать символы требуемых классов, остальные - из всех символов.
+    chars = [rng.choice(CLASSES[name])
+             for name, count in policy.items() for _ in range(count)]
+    chars += [rng.choice(ALPHABET) for _ in range(length - required)]
+    rng.shuffle(chars)
+
+    # Если первым оказалась цифра, поменять её местами со случайной буквой
+    # (хотя бы одна буква в пароле есть).
+    if chars[0] in NUMBERS:
+        letters = [index for index, ch in enumerate(chars)
+                   if ch not in NUMBERS]
+        if not letters:
+            index = rng.randrange(length)
+            chars[index] = rng.choice(UPPERS + LOWERS)
+            letters = [index]
+        index = rng.choice(letters)
+        chars[0], chars[index] = chars[index], chars[0]
 
     # Вернуть сгенерированный пароль.
-    return password
+    return ''.join(chars)
+
+
+def check_policy(length, policy):
+    """
+    Функция проверяет выполнимость требований к паролю заданной длины.
+
+    При невыполнимых требованиях или неизвестных классах символов
+    вызывается ValueError.
+    :param length: длина пароля,
+    :param policy: минимальное число символов каждого класса
+    ('upper', 'lower', 'digit').
+    :return: required - число обязательных символов (int).
+    """
+    unknown = set(policy).difference(CLASSES)
+    if unknown:
+        raise ValueError(f'Неизвестные классы символов: '
+                         f'{", ".join(sorted(unknown))}')
+    if any(count < 0 for count in policy.values()):
+        raise ValueError('Число символов класса не может быть отрицательным')
+
+    required = sum(policy.values())
+    if required > length or length < 1:
+        raise ValueError(f'Пароль из {length} символов не может содержать '
+                         f'{required} обязательных символов')
+    if policy.get('digit', 0) >= length:
+        raise ValueError('Первый символ пароля не может быть цифрой')
+
+    # Вернуть число обязательных символов.
+    return required
+
+
+def generate_passwords(count=None, length=PASSWORD_LENGTH,
+                       policy=PASSWORD_POLICY, batch=BATCH):
+    """
+    Функция-генератор выдаёт пароли, созданные из пула случайных байтов.
+
+    Пароли составляются так же, как get_password(), но символы
+    и перестановки берутся из BytePool: случайные байты получаются
+    от os.urandom() сразу для batch паролей, так что число обращений
+    к системе не зависит от требований к паролю.
+    :param count: число паролей (None - без ограничения),
+    :param length: длина пароля,
+    :param policy: минимальное число символов каждого класса
+    ('upper', 'lower', 'digit'),
+    :param batch: число паролей, для которых получаются байты за раз.
+    :return: генератор паролей (str).
+    """
+    check_policy(length, policy)
+    rng = BytePool(batch * length)
+    generated = 0
+
+    while count is None or generated < count:
+        yield get_password(length, policy, rng)
+        generated += 1
+
+
+class BytePool:
+    """
+    Генератор случайных выборов из пула байтов os.urandom().
+
+    Поддерживает методы random, которые нужны get_password(): choice(),
+    shuffle() и randrange(). Символы строки выбираются из заранее
+    подготовленного пула: байты отображаются в символы таблицей
+    bytes.translate(), байты сверх кратного числу символов удаляются
+    (чтобы все символы были равновероятны). Отбрасываются только байты,
+    а не пароли целиком.
+    """
+
+    def __init__(self, size=BATCH * PASSWORD_LENGTH):
+        """
+        Создать пустой пул.
+
+        :param size: число байтов, получаемых от os.urandom() за один раз.
+        """
+        self.size = size
+        self.data = b''
+        self.position = 0
+        self.pools = {}
+
+    def choice(self, seq):
+        """
+        Вернуть случайный элемент последовательности.
+
+        :param seq: строка символов или другая последовательность.
+        """
+        if not isinstance(seq, str):
+            return seq[self.randrange(len(seq))]
+
+        # Символы строки берутся из её пула (пополняемого при исчерпании).
+        chars, position = self.pools.get(seq, ('', 0))
+        if position == len(chars):
+            table, rejected = get_bytes_table(seq)
+            chars = os.urandom(self.size).translate(
+                table, rejected).decode('ascii')
+            position = 0
+        self.pools[seq] = (chars, position + 1)
+        return chars[position]
+
+    def shuffle(self, items):
+        """
+        Перемешать список на месте (алгоритм Фишера - Йетса).
+
+        :param items: перемешиваемый список.
+        """
+        for index in range(len(items) - 1, 0, -1):
+            other = self.randrange(index + 1)
+            items[index], items[other] = items[other], items[index]
+
+    def randrange(self, stop):
+        """
+        Вернуть случайное число от 0 до stop (не включая).
+
+        Числа из байтов больше кратного stop отбрасываются.
+        :param stop: верхняя граница.
+        """
+        size = max(1, (stop.bit_length() + 7) // 8)
+        limit = 256 ** size // stop * stop
+        while True:
+            if self.position + size > len(self.data):
+                self.data = os.urandom(self.size)
+                self.position = 0
+            if size == 1:
+                value = self.data[self.position]
+            else:
+                value = int.from_bytes(
+                    self.data[self.position:self.position + size], 'big')
+            self.position += size
+            if value < limit:
+                return value % stop
+
+
+@lru_cache
+def get_bytes_table(symbols):
+    """
+    Функция составляет таблицу отображения байтов в символы строки.
+
+    :param symbols: строка из не более чем 256 символов ASCII.
+    :return: таблица для bytes.translate() и удаляемые байты (tuple).
+    """
+    repeats = 256 // len(symbols)
+    accepted = len(symbols) * repeats
+    table = bytes.maketrans(bytes(range(accepted)),
+                            symbols.encode() * repeats)
+    return table, bytes(range(accepted, 256))
 
 
 def check_password(password):
@@ -249,6 +785,100 @@ def save_info(information, login, password):
     :param login: логин и
     :param password: пароль студента.
     """
+    # Открыть файл для записи (дозаписи) и записать в него строку.
+    with LoginWriter() as writer:
+        writer.write(information, login, password)
+
+
+class LoginWriter:
+    """
+    Сеанс записи информации о студентах в датированный CSV-файл.
+
+    Файл открывается один раз на весь сеанс, строки накапливаются
+    и записываются в файл частями по chunk строк (остаток записывается
+    при закрытии сеанса). Используется как контекстный менеджер.
+    """
+
+    def __init__(self, filename=None, chunk=CHUNK):
+        """
+        Открыть файл для записи (дозаписи).
+
+        :param filename: имя файла (по умолчанию - по текущей дате),
+        :param chunk: число строк, записываемых за один раз.
+        """
+        self.filename = get_filename() if filename is None else filename
+        self.chunk = chunk
+        self.rows = []
+        self.file = open(self.filename, 'a', newline='')
+        self.writer = csv.writer(self.file)
+
+    def __enter__(self):
+        """Вернуть сеанс записи."""
+        return self
+
+    def __exit__(self, *exc_info):
+        """Записать оставшиеся строки и закрыть файл."""
+        self.close()
+
+    def write(self, information, login, password, hashed=None):
+        """
+        Добавить строку с информацией о студенте.
+
+        :param information: информация о студенте,
+        :param login: логин и
+        :param password: пароль студента,
+        :param hashed: хеш пароля (записывается, если указан).
+        """
+        row = get_row(information, login, password)
+        if hashed is not None:
+            row.append(hashed)
+        self.write_row(row)
+
+    def write_row(self, row):
+        """
+        Добавить готовую строку CSV-файла.
+
+        :param row: список столбцов строки.
+        """
+        self.rows.append(row)
+        if len(self.rows) >= self.chunk:
+            self.flush()
+
+    def flush(self):
+        """Записать накопленные строки в файл."""
+        self.writer.writerows(self.rows)
+        self.rows.clear()
+
+    def close(self):
+        """Записать оставшиеся строки и закрыть файл."""
+        if not self.file.closed:
+            self.flush()
+            self.file.close()
+
+
+def get_row(information, login, password):
+    """
+    Функция формирует строку CSV-файла с информацией о студенте.
+
+    :param information: информация о студенте,
+    :param login: логин и
+    :param password: пароль студента.
+    :return: w_info - строка для записи в CSV-файл (list).
+    """
+    # Сформировать строку для записи в CSV-файл.
+    w_info = get_student_row(information) + [login, password]
+
+    # Вернуть строку.
+    return w_info
+
+
+def get_student_row(information):
+    """
+    Функция формирует столбцы CSV-файла с информацией о студенте.
+
+    :param information: информация о студенте.
+    :return: w_info - столбцы до логина и пароля (list).
+    """
     # Распаковать словарь с информацией о студенте.
     fullname = information['fullname']
     code = information['code']
@@ -261,17 +891,25 @@ def save_info(information, login, password):
     form = information['form']
     fullform = 'ОФО' if form == '1' else 'ЗФО'
 
-    # Сформировать строку для записи в CSV-файл.
-    w_info = [fullname, code, year, group, number, fullform, login, password]
+    # Сформировать столбцы для записи в CSV-файл.
+    w_info = [fullname, code, year, group, number, fullform]
+
+    # Вернуть строку.
+    return w_info
 
+
+def get_filename():
+    """
+    Функция формирует имя CSV-файла по текущей дате.
+
+    :return: имя файла вида logins_ГГГГ-М-Д.csv (str).
+    """
     # Сформировать дату для имени файла.
     cur_datetime = datetime.now()
     w_datetime = f'{cur_datetime.year}-{cur_datetime.month}-{cur_datetime.day}'
 
-    # Открыть файл для записи (дозаписи) и записать в него строку.
-    with open(f'logins_{w_datetime}.csv', 'a') as file:
-        writer = csv.writer(file)
-        writer.writerow(w_info)
+    # Вернуть имя файла.
+    return f'logins_{w_datetime}.csv'
 
 
 if __name__ == '__main__':